@@ -9,10 +9,11 @@ def convert_8bx1_to_4bx2(data: numpy.ndarray) -> numpy.ndarray:
     an array `[0xB, 0xA, 0xD, 0xC]`.
     """
     assert data.dtype == numpy.uint8
-    lo = data & 0xF
-    hi = data >> 4
-    data = numpy.stack((lo, hi)).T.reshape(-1)
-    return numpy.ascontiguousarray(data)
+    data = data.reshape(-1)
+    result = numpy.empty(data.size * 2, dtype=numpy.uint8)
+    result[0::2] = data & 0xF
+    result[1::2] = data >> 4
+    return result
 
 
 def convert_to_tiled_8x8(data: numpy.ndarray) -> numpy.ndarray:
@@ -61,18 +62,17 @@ def convert_a1rgb15_to_argb32(data: numpy.ndarray, use_alpha: bool = False) -> n
     Arguments:
         use_alpha: If true, read the alpha channel from the source.
     """
-    def convert_uint5_to_uint8(d):
-        return (d *0xFF // 0x1F).astype(numpy.uint8)
-    data = data.view(numpy.uint16)
+    data = data.view(numpy.uint16).reshape(-1)
+    # Components are written in place, without intermediate stacking
+    result = numpy.empty((data.size, 4), dtype=numpy.uint8)
+    result[:, 0] = ((data >> 10) & 0x1F) * 0xFF // 0x1F
+    result[:, 1] = ((data >> 5) & 0x1F) * 0xFF // 0x1F
+    result[:, 2] = (data & 0x1F) * 0xFF // 0x1F
     if use_alpha:
-        alpha = ((((data & 0x8000)) != 0) * 0xFF).astype(numpy.uint8)
+        result[:, 3] = (data >> 15) * 0xFF
     else:
-        alpha = numpy.full(data.size, 0xFF, dtype=numpy.uint8)
-    lo = convert_uint5_to_uint8(data & 0x1F)
-    mid = convert_uint5_to_uint8((data >> 5) & 0x1F)
-    hi = convert_uint5_to_uint8((data >> 10) & 0x1F)
-    data = numpy.stack((hi, mid, lo, alpha), dtype=numpy.uint8).T
-    return numpy.ascontiguousarray(data)
+        result[:, 3] = 0xFF
+    return result
 
 
 def translate_range_to_uint8(array: numpy.ndarray) -> numpy.ndarray:
@@ -245,6 +245,7 @@ class SearchContentBehavior(Behavior):
 
         def flushQueue():
             nonlocal nbFound
+            found: list[MemoryMap] = []
             try:
                 while newMem := memoryMapQueue.get(block=False):
                     if self.__insertionMode == InsertionMode.INSERT:
@@ -252,8 +253,7 @@ class SearchContentBehavior(Behavior):
                             # At the first found we remove the parent memory
                             memoryMapList.removeObject(mem)
                         nbFound += 1
-                        index = memoryMapList.indexAfterOffset(newMem.byte_offset)
-                        memoryMapList.insertObject(index, newMem)
+                        found.append(newMem)
                     elif self.__insertionMode == InsertionMode.SPLIT:
                         nbFound += 1
                         mem = rom.memory_map_containing_offset(newMem.byte_offset)
@@ -276,6 +276,8 @@ class SearchContentBehavior(Behavior):
                         raise RuntimeError(f"Unsupported {self.__insertionMode}")
             except queue.Empty:
                 pass
+            if len(found) != 0:
+                memoryMapList.insertMemoryMaps(found)
 
         runnable = SearchRunnable(
             rom=rom,
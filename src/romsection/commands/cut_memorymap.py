@@ -38,10 +38,8 @@ class CutMemoryMapCommand(ContextCommand):
 
         context = self.context()
         memoryMapList = context.memoryMapList()
-        index = memoryMapList.objectIndex(self._cutMem).row()
-        memoryMapList.removeObject(self._cutMem)
-        memoryMapList.insertObject(index, self._beforeOffsetMem)
-        memoryMapList.insertObject(index + 1, self._afterOffsetMem)
+        row = memoryMapList.objectIndex(self._cutMem).row()
+        memoryMapList.replaceObjects(row, 1, [self._beforeOffsetMem, self._afterOffsetMem])
 
     def undo(self):
         if self._cutMem is None:
@@ -49,7 +47,5 @@ class CutMemoryMapCommand(ContextCommand):
 
         context = self.context()
         memoryMapList = context.memoryMapList()
-        index = memoryMapList.objectIndex(self._beforeOffsetMem).row()
-        memoryMapList.removeObject(self._beforeOffsetMem)
-        memoryMapList.removeObject(self._afterOffsetMem)
-        memoryMapList.insertObject(index, self._cutMem)
+        row = memoryMapList.objectIndex(self._beforeOffsetMem).row()
+        memoryMapList.replaceObjects(row, 2, [self._cutMem])
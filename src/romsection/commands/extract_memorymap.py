@@ -51,22 +51,18 @@ class ExtractMemoryMapCommand(ContextCommand):
         else:
             self._afterMem = None
 
+    def _splitMems(self) -> list[MemoryMap]:
+        mems = [self._beforeMem, self._newMem, self._afterMem]
+        return [m for m in mems if m is not None]
+
     def redo(self):
         if self._cutMem is None:
             return
 
         context = self.context()
         memoryMapList = context.memoryMapList()
-        index = memoryMapList.objectIndex(self._cutMem).row()
-        memoryMapList.removeObject(self._cutMem)
-
-        if self._beforeMem is not None:
-            memoryMapList.insertObject(index, self._beforeMem)
-            index += 1
-        memoryMapList.insertObject(index, self._newMem)
-        index += 1
-        if self._afterMem is not None:
-            memoryMapList.insertObject(index, self._afterMem)
+        row = memoryMapList.objectIndex(self._cutMem).row()
+        memoryMapList.replaceObjects(row, 1, self._splitMems())
 
     def undo(self):
         if self._cutMem is None:
@@ -74,15 +70,6 @@ class ExtractMemoryMapCommand(ContextCommand):
 
         context = self.context()
         memoryMapList = context.memoryMapList()
-        index = -1
-
-        if self._beforeMem is not None:
-            index = memoryMapList.objectIndex(self._beforeMem).row()
-            memoryMapList.removeObject(self._beforeMem)
-        if index == -1:
-            index = memoryMapList.objectIndex(self._newMem).row()
-        memoryMapList.removeObject(self._newMem)
-        if self._afterMem is not None:
-            memoryMapList.removeObject(self._afterMem)
-
-        memoryMapList.insertObject(index, self._cutMem)
+        mems = self._splitMems()
+        row = memoryMapList.objectIndex(mems[0]).row()
+        memoryMapList.replaceObjects(row, len(mems), [self._cutMem])
@@ -1,2 +1,6 @@
+# Upper case hexadecimal rendering of each byte value
+BYTE_HEX: tuple[str, ...] = tuple(f"{i:02X}" for i in range(256))
+
+
 def format_address(address: int) -> str:
     return f"{address:08X}h"
@@ -8,6 +8,7 @@ import numpy
 import typing
 import dataclasses
 import hashlib
+import lru
 
 from .parsers import lz77
 from .parsers import huffman
@@ -17,6 +18,11 @@ from .codec import pixels_per_byte_length
 from .model import ByteCodec, DataType, ImageColorMode, ImagePixelOrder, MemoryMap
 
 
+def palette_key(mem: MemoryMap) -> tuple:
+    """Key of the memory map fields a decoded palette depends on."""
+    return mem.byte_offset, mem.byte_length, mem.byte_codec, mem.palette_size
+
+
 class GBAFile:
 
     def __init__(self, filename: str):
@@ -33,6 +39,8 @@ class GBAFile:
             raise ValueError(f"File '{filename}' does not have a valid GBA header")
         f.seek(0, os.SEEK_SET)
         self._f = f
+        # Decoded palettes, indexed by the memory map fields they depend on
+        self._palettes: lru.LRU[tuple, numpy.ndarray] = lru.LRU(512)
 
     def memory_map_from_offset(self, byte_offset: int):
         mem = [m for m in self.offsets if m.byte_offset == byte_offset]
@@ -181,15 +189,27 @@ class GBAFile:
 
         The RBG values are in range of 0..255.
 
+        The returned array is read only, as it is shared between calls.
+
         Raises:
             ValueError: If the memory can't be read as a palette.
         """
-        data = self.extract_data(mem)
-        array = numpy.frombuffer(data, dtype=numpy.uint8)
-
         if mem.data_type != DataType.PALETTE:
             raise ValueError(f"Memory map 0x{mem.byte_offset:08X} is not a palette")
 
+        key = palette_key(mem)
+        array = self._palettes.get(key)
+        if array is None:
+            array = self._decode_palette(mem)
+            array.flags.writeable = False
+            self._palettes[key] = array
+        # A view, so the caller can reshape it
+        return array.view()
+
+    def _decode_palette(self, mem: MemoryMap) -> numpy.ndarray:
+        data = self.extract_data(mem)
+        array = numpy.frombuffer(data, dtype=numpy.uint8)
+
         size = mem.palette_size if mem.palette_size is not None else 16
         byte_per_color = 2
 
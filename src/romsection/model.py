@@ -1,5 +1,6 @@
 import enum
 import typing
+import functools
 import dataclasses
 
 
@@ -220,6 +221,11 @@ class MemoryMap:
     def byte_end(self) -> int:
         return self.byte_offset + (self.byte_length or 0)
 
+    @functools.cached_property
+    def byte_effective_length(self) -> int:
+        """Useful byte length if known, else the size in the ROM."""
+        return self.byte_payload or self.byte_length or 0
+
     def replace(self, *args, **kwargs):
         return dataclasses.replace(self, *args, **kwargs)
 
@@ -1,3 +1,4 @@
+import struct
 import typing
 
 
@@ -5,6 +6,10 @@ GBA_HEADER_SIZE = 192
 
 EXTANDED_GBA_HEADER_SIZE = 228
 
+# Entry point, logo, title, game code, maker code, fixed value, unit code,
+# device type, reserved, version, checksum, reserved
+_GBA_HEADER_STRUCT = struct.Struct("<4s156s12s4s2sBBB7sBB2s")
+
 
 def _as_struct(data: bytes, description: list[tuple[int, str]]) -> list[tuple[int, bytes, str]]:
     pos = 0
@@ -32,12 +37,16 @@ def format_32bit_opcode(memory: bytes, baseAddress: int) -> str:
 class GbaHeader(typing.NamedTuple):
     @staticmethod
     def parse_struct(data: bytes) -> list[tuple[int, bytes, str]]:
-        gameTitle = data[0xA0:0xAC].rstrip(b"\x00").decode()
-        gameCode = data[0xAC:0xB0].rstrip(b"\x00").decode()
-        makerCode = data[0xB0:0xB2].rstrip(b"\x00").decode()
+        if len(data) < GBA_HEADER_SIZE:
+            return _as_struct(data, [(len(data), "Invalid header")])
+        fields = _GBA_HEADER_STRUCT.unpack_from(data)
+        entryPoint = fields[0]
+        gameTitle = fields[2].rstrip(b"\x00").decode()
+        gameCode = fields[3].rstrip(b"\x00").decode()
+        makerCode = fields[4].rstrip(b"\x00").decode()
         description = [
             # Address 00h
-            (4, f"ROM entry point: {format_32bit_opcode(data[0x00:0x04], 0x00)}"),
+            (4, f"ROM entry point: {format_32bit_opcode(entryPoint, 0x00)}"),
             # 156 bytes...
             (12, f"Nintendo logo"),
             (12, ""),
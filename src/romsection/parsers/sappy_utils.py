@@ -13,6 +13,14 @@ See https://www.romhacking.net/documents/462/
 
 UNUSED_INSTRUMENT = b"\x01\x3c\x00\x00\x02\x00\x00\x00\x00\x00\x0f\x00"
 
+# Precompiled layouts of the parsed structures
+_INSTRUMENT_STRUCT = struct.Struct("<BBBBLBBBB")
+_INSTRUMENT_SPLIT_STRUCT = struct.Struct("<BBBBLL")
+_SAMPLE_HEADER_STRUCT = struct.Struct("<BBBBLLL")
+_SONG_TABLE_ITEM_STRUCT = struct.Struct("<LBBBB")
+_SONG_HEADER_STRUCT = struct.Struct("<BBBBL")
+_ADDRESS_STRUCT = struct.Struct("<L")
+
 
 def _as_struct(data: bytes, description: list[tuple[int, str]]) -> list[tuple[int, bytes, str]]:
     pos = 0
@@ -44,12 +52,12 @@ class InstrumentSampleItem(typing.NamedTuple):
 
     @staticmethod
     def parse(data: bytes) -> "InstrumentSampleItem":
-        res = struct.unpack("<BBBBLBBBB", data)
+        res = _INSTRUMENT_STRUCT.unpack(data)
         return InstrumentSampleItem._make(res)
 
     @staticmethod
     def parse_struct(data: bytes) -> list[tuple[int, bytes, str]]:
-        obj = struct.unpack("<BBBBLBBBB", data)
+        obj = _INSTRUMENT_STRUCT.unpack(data)
         description = [
             (1, "Sample instrument (GBA Direct Sound channel)"),
             (1, f"Key: {obj[1]}"),
@@ -81,12 +89,12 @@ class InstrumentPsgItem(typing.NamedTuple):
 
     @staticmethod
     def parse(data: bytes) -> "InstrumentPsgItem":
-        res = struct.unpack("<BBBBLBBBB", data)
+        res = _INSTRUMENT_STRUCT.unpack(data)
         return InstrumentPsgItem._make(res)
 
     @staticmethod
     def parse_struct(data: bytes) -> list[tuple[int, bytes, str]]:
-        obj = struct.unpack("<BBBBLBBBB", data)
+        obj = _INSTRUMENT_STRUCT.unpack(data)
         description = [
             (1, "PSG instrument / sub-instrument"),
             (0, f"Channel: {obj[0]}"),
@@ -116,12 +124,12 @@ class InstrumentKeySplitItem(typing.NamedTuple):
 
     @staticmethod
     def parse(data: bytes) -> "InstrumentKeySplitItem":
-        res = struct.unpack("<BBBBLL", data)
+        res = _INSTRUMENT_SPLIT_STRUCT.unpack(data)
         return InstrumentKeySplitItem._make(res)
 
     @staticmethod
     def parse_struct(data: bytes) -> list[tuple[int, bytes, str]]:
-        obj = struct.unpack("<BBBBLL", data)
+        obj = _INSTRUMENT_SPLIT_STRUCT.unpack(data)
         description = [
             (1, "Key-Split instruments"),
             (1, f"Unused: should be 00"),
@@ -147,12 +155,12 @@ class InstrumentEveryKeySplitItem(typing.NamedTuple):
 
     @staticmethod
     def parse(data: bytes) -> "InstrumentEveryKeySplitItem":
-        res = struct.unpack("<BBBBLL", data)
+        res = _INSTRUMENT_SPLIT_STRUCT.unpack(data)
         return InstrumentEveryKeySplitItem._make(res)
 
     @staticmethod
     def parse_struct(data: bytes) -> list[tuple[int, bytes, str]]:
-        obj = struct.unpack("<BBBBLL", data)
+        obj = _INSTRUMENT_SPLIT_STRUCT.unpack(data)
         description = [
             (1, "Every Key Split instrument (percussion)"),
             (1, f"Unused: should be 00"),
@@ -226,6 +234,38 @@ class InstrumentItem(typing.NamedTuple):
             return InstrumentEveryKeySplitItem.parse_struct(data)
         return InstrumentInvalidItem.parse_struct(data)
 
+    @staticmethod
+    def parse_short_descriptions(data: bytes) -> list[str]:
+        """Short description of each item of an instrument table.
+
+        Equivalent to `InstrumentItem.parse(item).short_description` for
+        each full item, but the kinds are classified at once with numpy.
+        """
+        nb = len(data) // INSTRUMENT_TABLE_ITEM_SIZE
+        items = numpy.frombuffer(data, dtype=numpy.uint8, count=nb * INSTRUMENT_TABLE_ITEM_SIZE)
+        items = items.reshape(nb, INSTRUMENT_TABLE_ITEM_SIZE)
+        kinds = _INSTRUMENT_KIND_DESCRIPTION[items[:, 0]]
+        unused = (items == numpy.frombuffer(UNUSED_INSTRUMENT, dtype=numpy.uint8)).all(axis=1)
+        kinds[unused] = 4
+        return [_INSTRUMENT_DESCRIPTIONS[k] for k in kinds.tolist()]
+
+
+_INSTRUMENT_DESCRIPTIONS = (
+    "Sample (GBA Direct Sound channel)",
+    "PSG instrument / sub-instrument",
+    "Key-Split instruments",
+    "Every Key Split instrument (percussion)",
+    "Unused instrument",
+    "Invalid instrument",
+)
+
+# Index in `_INSTRUMENT_DESCRIPTIONS` for each instrument kind
+_INSTRUMENT_KIND_DESCRIPTION = numpy.full(256, 5, dtype=numpy.uint8)
+_INSTRUMENT_KIND_DESCRIPTION[[0x00, 0x08, 0x10, 0x20]] = 0
+_INSTRUMENT_KIND_DESCRIPTION[[0x01, 0x02, 0x03, 0x04, 0x09, 0x0A, 0x0B, 0x0C]] = 1
+_INSTRUMENT_KIND_DESCRIPTION[0x40] = 2
+_INSTRUMENT_KIND_DESCRIPTION[0x80] = 3
+
 
 SAMPLE_HEADER_SIZE = 16
 
@@ -252,12 +292,12 @@ class SampleHeader(typing.NamedTuple):
 
     @staticmethod
     def parse(data: bytes) -> "SampleHeader":
-        res = struct.unpack("<BBBBLLL", data)
+        res = _SAMPLE_HEADER_STRUCT.unpack(data)
         return SampleHeader._make(res)
 
     @staticmethod
     def parse_struct(data: bytes) -> list[tuple[int, bytes, str]]:
-        obj = struct.unpack("<BBBBLLL", data)
+        obj = _SAMPLE_HEADER_STRUCT.unpack(data)
         description = [
             (1, f"Unused: should be 00"),
             (1, f"Unused: should be 00"),
@@ -296,12 +336,12 @@ class SongTableItem(typing.NamedTuple):
 
     @staticmethod
     def parse(data: bytes) -> "SongTableItem":
-        res = struct.unpack("<LBBBB", data)
+        res = _SONG_TABLE_ITEM_STRUCT.unpack(data)
         return SongTableItem._make(res)
 
     @staticmethod
     def parse_struct(data: bytes) -> list[tuple[int, bytes, str]]:
-        obj = struct.unpack("<LBBBB", data)
+        obj = _SONG_TABLE_ITEM_STRUCT.unpack(data)
         description = [
             (4, f"Song header address: {obj[0] - 0x8000000:08X}h"),
             (1, f"Track group: {obj[1]}"),
@@ -311,6 +351,36 @@ class SongTableItem(typing.NamedTuple):
         ]
         return _as_struct(data, description)
 
+    @staticmethod
+    def parse_short_descriptions(data: bytes) -> list[str]:
+        """Short description of each item of a song table.
+
+        Equivalent to `SongTableItem.parse(item).short_description` for
+        each full item, but the fields are decoded at once with numpy.
+        """
+        nb = len(data) // SONG_TABLE_ITEM_SIZE
+        items = numpy.frombuffer(data, dtype=_SONG_TABLE_ITEM_DTYPE, count=nb)
+        valid = (
+            (items["zero1"] == 0)
+            & (items["zero2"] == 0)
+            & (items["track_group"] == items["track_group2"])
+        )
+        addresses = (items["song_header_address"].astype(numpy.int64) - 0x08000000).tolist()
+        track_groups = items["track_group"].tolist()
+        return [
+            f"Song header: {a:08X}h; track group: {t}" if v else "Invalid song address"
+            for a, t, v in zip(addresses, track_groups, valid.tolist())
+        ]
+
+
+_SONG_TABLE_ITEM_DTYPE = numpy.dtype([
+    ("song_header_address", "<u4"),
+    ("track_group", "u1"),
+    ("zero1", "u1"),
+    ("track_group2", "u1"),
+    ("zero2", "u1"),
+])
+
 
 class SongHeader(typing.NamedTuple):
     nb_tracks: int
@@ -354,7 +424,7 @@ class SongHeader(typing.NamedTuple):
     def parse(data: bytes) -> "SongHeader":
         if data == b"\x00\x00\x00\x00":
             return SongHeader(0, 0, 0, 0)
-        res = struct.unpack("<BBBBL", data[:8])
+        res = _SONG_HEADER_STRUCT.unpack(data[:8])
         nb_tracks = res[0]
 
         max_parsable = len(data) - len(data) % 4
@@ -412,7 +482,7 @@ class SongHeader(typing.NamedTuple):
         instrument_address = stream.read(4)
         if len(instrument_address) != 4:
             return result
-        address = struct.unpack("<L", instrument_address)
+        address = _ADDRESS_STRUCT.unpack(instrument_address)
         result.append((pos, instrument_address, f"Instrument address: {address[0] - 0x8000000:08X}h"))
 
         for nb in range(nb_tracks[0]):
@@ -420,7 +490,7 @@ class SongHeader(typing.NamedTuple):
             track_data_address = stream.read(4)
             if len(track_data_address) != 4:
                 return result
-            address = struct.unpack("<L", track_data_address)
+            address = _ADDRESS_STRUCT.unpack(track_data_address)
             result.append((pos, track_data_address, f"Track data address #{nb}: {address[0] - 0x8000000:08X}h"))
 
         return result
@@ -12,6 +12,16 @@ def blockSignals(widget: Qt.QWidget):
         widget.blockSignals(old)
 
 
+@contextlib.contextmanager
+def updatesDisabled(widget: Qt.QWidget):
+    try:
+        old = widget.updatesEnabled()
+        widget.setUpdatesEnabled(False)
+        yield
+    finally:
+        widget.setUpdatesEnabled(old)
+
+
 @contextlib.contextmanager
 def exceptionAsMessageBox(
     parent: Qt.QWidget | None = None,
@@ -11,8 +11,9 @@ from ..behaviors import lz77_content
 from ..behaviors import rl_content
 from ..behaviors import huffman_content
 from ..format_utils import format_address as f_address
-from ..model import MemoryMap, ByteCodec, DataType
+from ..model import MemoryMap, ByteCodec, DataType, ImageColorMode, ImagePixelOrder
 from .sample_browser_widget import SampleBrowserWidget
+from .sample_codec_combo_box import SampleCodecs
 from .pixel_browser_widget import PixelBrowserWidget
 from .sample_codec_combo_box import SampleCodecComboBox
 from .pixel_browser_widget import PixelBrowserWidget
@@ -20,49 +21,45 @@ from .image_pixel_order_combo import ImagePixelOrderCombo
 from .image_color_mode_combo import ImageColorModeCombo
 from .combo_box import ComboBox
 from .hexa_view import HexaView
+from . import ui_styles
 from ..context import Context
 from ..behaviors.behavior import Behavior
 from ..commands.cut_memorymap import CutMemoryMapCommand
+from ..commands.extract_memorymap import ExtractMemoryMapCommand
 
 
 class PixelTools:
     """Holder for tools related to pixel browsing"""
     def __init__(self, toolBar: Qt.QToolBar):
         self.__view: PixelBrowserWidget | None = None
-        self.__actions: list[Qt.QAction] = []
 
         self.__zoom = Qt.QSpinBox(toolBar)
         self.__zoom.setRange(1, 16)
-        action = toolBar.addWidget(self.__zoom)
-        self.__actions.append(action)
 
         self.__pixelWidth = Qt.QSpinBox(toolBar)
         self.__pixelWidth.setRange(1, 128 * 4)
-        action = toolBar.addWidget(self.__pixelWidth)
-        self.__actions.append(action)
 
         self.__colorMode = ImageColorModeCombo(toolBar)
-        action = toolBar.addWidget(self.__colorMode)
-        self.__actions.append(action)
-
         self.__pixelOrder = ImagePixelOrderCombo(toolBar)
-        action = toolBar.addWidget(self.__pixelOrder)
-        self.__actions.append(action)
+
+        with qt_utils.updatesDisabled(toolBar):
+            self.__actions: list[Qt.QAction] = [
+                toolBar.addWidget(self.__zoom),
+                toolBar.addWidget(self.__pixelWidth),
+                toolBar.addWidget(self.__colorMode),
+                toolBar.addWidget(self.__pixelOrder),
+            ]
+
+        self.__zoom.valueChanged.connect(self._onZoom)
+        self.__pixelWidth.valueChanged.connect(self._onPixelWidth)
+        self.__colorMode.valueChanged.connect(self._onColorMode)
+        self.__pixelOrder.valueChanged.connect(self._onPixelOrder)
 
     def setView(self, view: PixelBrowserWidget | None):
         if self.__view is view:
             return
-        if self.__view is not None:
-            self.__zoom.valueChanged.disconnect(self.__view.setZoom)
-            self.__pixelWidth.valueChanged.disconnect(self.__view.setPixelWidth)
-            self.__colorMode.valueChanged.disconnect(self.__view.setColorMode)
-            self.__pixelOrder.valueChanged.disconnect(self.__view.setPixelOrder)
         self.__view = view
         if self.__view is not None:
-            self.__zoom.valueChanged.connect(self.__view.setZoom)
-            self.__pixelWidth.valueChanged.connect(self.__view.setPixelWidth)
-            self.__colorMode.valueChanged.connect(self.__view.setColorMode)
-            self.__pixelOrder.valueChanged.connect(self.__view.setPixelOrder)
             self.__zoom.setValue(self.__view.zoom())
         # Setup the state
         if self.__view is not None:
@@ -77,40 +74,55 @@ class PixelTools:
         for action in self.__actions:
             action.setVisible(visible)
 
+    def _onZoom(self, zoom: int):
+        if self.__view is not None:
+            self.__view.setZoom(zoom)
+
+    def _onPixelWidth(self, pixelWidth: int):
+        if self.__view is not None:
+            self.__view.setPixelWidth(pixelWidth)
+
+    def _onColorMode(self, colorMode: ImageColorMode):
+        if self.__view is not None:
+            self.__view.setColorMode(colorMode)
+
+    def _onPixelOrder(self, pixelOrder: ImagePixelOrder):
+        if self.__view is not None:
+            self.__view.setPixelOrder(pixelOrder)
+
 
 class SampleTools:
     """Holder for tools related to sample browsing"""
     def __init__(self, toolBar: Qt.QToolBar):
         self.__view: SampleBrowserWidget | None = None
-        self.__actions: list[Qt.QAction] = []
 
         self.__samplePerPixels = Qt.QSpinBox(toolBar)
         self.__samplePerPixels.setRange(1, 128)
-        action = toolBar.addWidget(self.__samplePerPixels)
-        self.__actions.append(action)
 
         self.__sampleCodec = SampleCodecComboBox(toolBar)
-        action = toolBar.addWidget(self.__sampleCodec)
-        self.__actions.append(action)
 
         self.__playButton = Qt.QPushButton(toolBar)
         self.__playButton.clicked.connect(self._playback)
         self.__playButton.setToolTip("Playback visible data only")
-        self.__playButton.setIcon(Qt.QIcon("icons:play.png"))
-        action = toolBar.addWidget(self.__playButton)
-        self.__actions.append(action)
+        self.__playButton.setIcon(ui_styles.getIconFromName("icons:play.png"))
+
+        with qt_utils.updatesDisabled(toolBar):
+            self.__actions: list[Qt.QAction] = [
+                toolBar.addWidget(self.__samplePerPixels),
+                toolBar.addWidget(self.__sampleCodec),
+                toolBar.addWidget(self.__playButton),
+            ]
+
+        self.__samplePerPixels.valueChanged.connect(self._onNbSamplePerPixels)
+        self.__sampleCodec.valueChanged.connect(self._onSampleCodec)
 
     def setView(self, view: SampleBrowserWidget | None):
         if self.__view is view:
             return
         if self.__view is not None:
-            self.__samplePerPixels.valueChanged.disconnect(self.__view.setNbSamplePerPixels)
-            self.__sampleCodec.valueChanged.disconnect(self.__view.setSampleCodec)
             self.__view.playbackChanged.disconnect(self._onPlaybackChanged)
         self.__view = view
         if self.__view is not None:
-            self.__samplePerPixels.valueChanged.connect(self.__view.setNbSamplePerPixels)
-            self.__sampleCodec.valueChanged.connect(self.__view.setSampleCodec)
             self.__view.playbackChanged.connect(self._onPlaybackChanged)
         # Setup the state
         if self.__view is not None:
@@ -121,6 +133,14 @@ class SampleTools:
         for action in self.__actions:
             action.setVisible(visible)
 
+    def _onNbSamplePerPixels(self, nbSamplePerPixels: int):
+        if self.__view is not None:
+            self.__view.setNbSamplePerPixels(nbSamplePerPixels)
+
+    def _onSampleCodec(self, sampleCodec: SampleCodecs):
+        if self.__view is not None:
+            self.__view.setSampleCodec(sampleCodec)
+
     def _playback(self):
         view = self.__view
         if view is None:
@@ -132,9 +152,9 @@ class SampleTools:
 
     def _onPlaybackChanged(self, playing: bool):
         if playing:
-            self.__playButton.setIcon(Qt.QIcon("icons:stop.png"))
+            self.__playButton.setIcon(ui_styles.getIconFromName("icons:stop.png"))
         else:
-            self.__playButton.setIcon(Qt.QIcon("icons:play.png"))
+            self.__playButton.setIcon(ui_styles.getIconFromName("icons:play.png"))
 
 
 class DataBrowser(Qt.QWidget):
@@ -149,6 +169,13 @@ class DataBrowser(Qt.QWidget):
         self.__address: int = 0
         self.__rom: GBAFile | None = None
         self.__mem: MemoryMap | None = None
+        # Last state propagated to the views, -1 means nothing propagated yet
+        self.__lastSelection: tuple[int, int] | None = (-1, -1)
+        self.__lastPosition: int = -1
+        self.__memoryLength: int = 0
+        # Last relative selection converted by `_toAbsolute`, and its result
+        self.__absoluteFrom: tuple[int, int] | None = None
+        self.__absolute: tuple[int, int] = (0, 0)
 
         self.__toolbar = Qt.QToolBar(self)
         self.__statusbar = Qt.QStatusBar(self)
@@ -188,7 +215,7 @@ class DataBrowser(Qt.QWidget):
         ]
 
         action = Qt.QAction(self)
-        action.setIcon(Qt.QIcon("icons:hexa.png"))
+        action.setIcon(ui_styles.getIconFromName("icons:hexa.png"))
         action.setCheckable(True)
         action.setText("Hex viewer")
         action.setToolTip("Show hexa viewer")
@@ -200,7 +227,7 @@ class DataBrowser(Qt.QWidget):
         self.__toolbar.addSeparator()
 
         action = Qt.QAction(self)
-        action.setIcon(Qt.QIcon("icons:image.png"))
+        action.setIcon(ui_styles.getIconFromName("icons:image.png"))
         action.setCheckable(True)
         action.setText("Pixel viewer")
         action.setToolTip("Show pixel viewer")
@@ -215,7 +242,7 @@ class DataBrowser(Qt.QWidget):
         self.__toolbar.addSeparator()
 
         action = Qt.QAction(self)
-        action.setIcon(Qt.QIcon("icons:sample.png"))
+        action.setIcon(ui_styles.getIconFromName("icons:sample.png"))
         action.setCheckable(True)
         action.setText("Audio wave viewer")
         action.setToolTip("Show audio wave viewer")
@@ -253,20 +280,19 @@ class DataBrowser(Qt.QWidget):
             b.setContext(context)
 
     def __onSelectionChanged(self, selection: tuple[int, int] | None):
+        if selection == self.__lastSelection:
+            return
+        self.__lastSelection = selection
+        sender = self.sender()
         # Assume each widget have the same address origin
-        with qt_utils.blockSignals(self.__wave):
-            self.__wave.setSelection(selection)
-        with qt_utils.blockSignals(self.__pixel):
-            self.__pixel.setSelection(selection)
+        if sender is not self.__wave:
+            with qt_utils.blockSignals(self.__wave):
+                self.__wave.setSelection(selection)
+        if sender is not self.__pixel:
+            with qt_utils.blockSignals(self.__pixel):
+                self.__pixel.setSelection(selection)
         with qt_utils.blockSignals(self.__hexa):
-            if selection is None:
-                address = None
-            else:
-                address = (
-                    self.__address + selection[0],
-                    self.__address + selection[1]
-                )
-            self.__hexa.setAddressSelection(address)
+            self.__hexa.setAddressSelection(self._toAbsolute(selection))
         self._updateSelection(self.selection())
 
     def _updateSelection(self, selection: tuple[int, int] | None):
@@ -281,28 +307,53 @@ class DataBrowser(Qt.QWidget):
 
     def selection(self) -> tuple[int, int] | None:
         """Return the address selection"""
-        selection = self.__pixel.selection()
+        return self._toAbsolute(self.__pixel.selection())
+
+    def _toAbsolute(self, selection: tuple[int, int] | None) -> tuple[int, int] | None:
+        """Convert a selection relative to the memory into addresses.
+
+        The last conversion is memoized, as it is requested several times
+        per selection change.
+        """
         if selection is None:
             return None
-        return self.__address + selection[0], self.__address + selection[1]
+        if selection != self.__absoluteFrom:
+            self.__absoluteFrom = selection
+            self.__absolute = (
+                self.__address + selection[0],
+                self.__address + selection[1]
+            )
+        return self.__absolute
 
     def __positionChanged(self, position: int):
-        with qt_utils.blockSignals(self.__pixel):
-            self.__pixel.setPosition(position)
-        with qt_utils.blockSignals(self.__wave):
-            self.__wave.setPosition(position)
+        if position == self.__lastPosition:
+            return
+        self.__lastPosition = position
+        sender = self.sender()
+        if sender is not self.__pixel:
+            with qt_utils.blockSignals(self.__pixel):
+                self.__pixel.setPosition(position)
+        if sender is not self.__wave:
+            with qt_utils.blockSignals(self.__wave):
+                self.__wave.setPosition(position)
         with qt_utils.blockSignals(self.__hexa):
             self.__hexa.setPosition(position)
 
     def setPixelVisible(self, visible: bool):
+        if self.__pixel.isHidden() != visible:
+            return
         self.__pixel.setVisible(visible)
         self.__pixelTools.setVisible(visible)
 
     def setWaveVisible(self, visible: bool):
+        if self.__wave.isHidden() != visible:
+            return
         self.__wave.setVisible(visible)
         self.__waveTools.setVisible(visible)
 
     def setHexaVisible(self, visible: bool):
+        if self.__hexa.isHidden() != visible:
+            return
         self.__hexa.setVisible(visible)
 
     def rom(self) -> GBAFile | None:
@@ -322,18 +373,15 @@ class DataBrowser(Qt.QWidget):
         self.setPosition(pos)
 
     def keyPressEvent(self, event: Qt.QKeyEvent):
-        if event.key() == Qt.Qt.Key_Left:
-            self.moveToPreviousByte()
-        elif event.key() == Qt.Qt.Key_Right:
-            self.moveToNextByte()
-        elif event.key() == Qt.Qt.Key_PageUp:
-            self.moveToPreviousPage()
-        elif event.key() == Qt.Qt.Key_PageDown:
-            self.moveToNextPage()
+        move = self._KEY_MOVES.get(event.key())
+        if move is None:
+            Qt.QWidget.keyPressEvent(self, event)
+            return
+        move(self)
 
     def moveToNextByte(self):
         pos = self.__wave.position() + 1
-        pos = min(pos, self.__wave.memoryLength())
+        pos = min(pos, self.__memoryLength)
         self.setPosition(pos)
 
     def moveToPreviousPage(self):
@@ -345,16 +393,28 @@ class DataBrowser(Qt.QWidget):
     def moveToNextPage(self):
         # FIXME: Have to be improved
         pos = self.__wave.position() + self.__wave.width()
-        pos = min(pos, self.__wave.memoryLength())
+        pos = min(pos, self.__memoryLength)
         self.setPosition(pos)
 
+    _KEY_MOVES = {
+        Qt.Qt.Key_Left: moveToPreviousByte,
+        Qt.Qt.Key_Right: moveToNextByte,
+        Qt.Qt.Key_PageUp: moveToPreviousPage,
+        Qt.Qt.Key_PageDown: moveToNextPage,
+    }
+
     def memory(self) -> io.IOBase:
         return self.__wave.memory()
 
     def setMemory(self, memory: io.IOBase, address: int = 0):
         self.__address = address
+        self.__absoluteFrom = None
+        # The views reset their state without notification
+        self.__lastSelection = (-1, -1)
+        self.__lastPosition = -1
         self.__pixel.setMemory(memory)
         self.__wave.setMemory(memory)
+        self.__memoryLength = self.__wave.memoryLength()
         self.__hexa.setMemory(memory, address=address)
         self.setPosition(0)
 
@@ -415,46 +475,21 @@ class DataBrowser(Qt.QWidget):
         if selection is None:
             return
 
-        if selection[0] != mem.byte_offset:
-            prevMem = MemoryMap(
-                byte_offset=mem.byte_offset,
-                byte_length=selection[0] - mem.byte_offset,
-                byte_codec=mem.byte_codec,
-                data_type=DataType.UNKNOWN,
-            )
-        else:
-            prevMem = None
-
+        context = self.__context
+        pixel = self.__pixel
         selectedMem = MemoryMap(
             byte_offset=selection[0],
             byte_length=selection[1] - selection[0],
             byte_codec=mem.byte_codec,
             data_type=DataType.IMAGE,
-            image_color_mode=self.__pixel.colorMode(),
-            image_pixel_order=self.__pixel.pixelOrder(),
+            image_color_mode=pixel.colorMode(),
+            image_pixel_order=pixel.pixelOrder(),
         )
 
-        if selection[1] != mem.byte_offset + mem.byte_length:
-            nextMem = MemoryMap(
-                byte_offset=selection[1],
-                byte_length=mem.byte_offset + mem.byte_length - selection[1],
-                byte_codec=mem.byte_codec,
-                data_type=DataType.UNKNOWN,
-            )
-        else:
-            nextMem = None
-
-        memoryMapList = self.__context.memoryMapList()
-        index = memoryMapList.objectIndex(mem).row()
-        memoryMapList.removeObject(mem)
-        if prevMem is not None:
-            memoryMapList.insertObject(index, prevMem)
-            index += 1
-        if selectedMem is not None:
-            memoryMapList.insertObject(index, selectedMem)
-            index += 1
-        if nextMem is not None:
-            memoryMapList.insertObject(index, nextMem)
+        with qt_utils.exceptionAsMessageBox(context.mainWidget()):
+            command = ExtractMemoryMapCommand()
+            command.setCommand(mem, selectedMem)
+            context.pushCommand(command)
 
     def _showHexaContextMenu(self, pos: Qt.QPoint):
         globalPos = self.__hexa.mapToGlobal(pos)
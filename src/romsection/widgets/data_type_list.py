@@ -1,9 +1,27 @@
 from PyQt5 import Qt
 
 from ..gba_file import DataType
+from ..qt_utils import blockSignals, updatesDisabled
 from . import ui_styles
 
 
+_ITEMS: tuple[tuple[str, DataType], ...] = (
+    ("GBA ROM header", DataType.GBA_ROM_HEADER),
+    ("Image", DataType.IMAGE),
+    ("Palette", DataType.PALETTE),
+    ("Tile set", DataType.TILE_SET),
+    ("Padding", DataType.PADDING),
+    ("Sample (sappy)", DataType.SAMPLE_SAPPY),
+    ("Sample Int8", DataType.SAMPLE_INT8),
+    ("Music instrument (sappy)", DataType.MUSIC_INSTRUMENT_SAPPY),
+    ("Music song address (sappy)", DataType.MUSIC_SONG_TABLE_SAPPY),
+    ("Music song header (sappy)", DataType.MUSIC_SONG_HEADER_SAPPY),
+    ("Music song track (sappy)", DataType.MUSIC_TRACK_SAPPY),
+    ("Music key split table (sappy)", DataType.MUSIC_KEY_SPLIT_TABLE_SAPPY),
+    ("Unknown", DataType.UNKNOWN),
+)
+
+
 class DataTypeList(Qt.QListWidget):
 
     valueChanged = Qt.pyqtSignal(object)
@@ -16,87 +34,18 @@ class DataTypeList(Qt.QListWidget):
         self.setSizeAdjustPolicy(Qt.QListWidget.AdjustToContents)
         self.setResizeMode(Qt.QListView.Fixed)
 
-        item = Qt.QListWidgetItem()
-        item.setText(f"GBA ROM header")
-        item.setData(Qt.Qt.UserRole, DataType.GBA_ROM_HEADER)
-        item.setIcon(ui_styles.getIcon(DataType.GBA_ROM_HEADER))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Image")
-        item.setData(Qt.Qt.UserRole, DataType.IMAGE)
-        item.setIcon(ui_styles.getIcon(DataType.IMAGE))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Palette")
-        item.setData(Qt.Qt.UserRole, DataType.PALETTE)
-        item.setIcon(ui_styles.getIcon(DataType.PALETTE))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Tile set")
-        item.setData(Qt.Qt.UserRole, DataType.TILE_SET)
-        item.setIcon(ui_styles.getIcon(DataType.TILE_SET))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Padding")
-        item.setData(Qt.Qt.UserRole, DataType.PADDING)
-        item.setIcon(ui_styles.getIcon(DataType.PADDING))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Sample (sappy)")
-        item.setData(Qt.Qt.UserRole, DataType.SAMPLE_SAPPY)
-        item.setIcon(ui_styles.getIcon(DataType.SAMPLE_SAPPY))
-        self.addItem(item)
+        self.__rowByValue: dict[DataType, int] = {}
 
-        item = Qt.QListWidgetItem()
-        item.setText(f"Sample Int8")
-        item.setData(Qt.Qt.UserRole, DataType.SAMPLE_INT8)
-        item.setIcon(ui_styles.getIcon(DataType.SAMPLE_INT8))
-        self.addItem(item)
+        with updatesDisabled(self), blockSignals(self):
+            self.addItems([text for text, _ in _ITEMS])
+            for row, (_, dataType) in enumerate(_ITEMS):
+                item = self.item(row)
+                item.setData(Qt.Qt.UserRole, dataType)
+                item.setIcon(ui_styles.getIcon(dataType))
+                self.__rowByValue[dataType] = row
 
-        item = Qt.QListWidgetItem()
-        item.setText(f"Music instrument (sappy)")
-        item.setData(Qt.Qt.UserRole, DataType.MUSIC_INSTRUMENT_SAPPY)
-        item.setIcon(ui_styles.getIcon(DataType.MUSIC_INSTRUMENT_SAPPY))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Music song address (sappy)")
-        item.setData(Qt.Qt.UserRole, DataType.MUSIC_SONG_TABLE_SAPPY)
-        item.setIcon(ui_styles.getIcon(DataType.MUSIC_SONG_TABLE_SAPPY))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Music song header (sappy)")
-        item.setData(Qt.Qt.UserRole, DataType.MUSIC_SONG_HEADER_SAPPY)
-        item.setIcon(ui_styles.getIcon(DataType.MUSIC_SONG_HEADER_SAPPY))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Music song track (sappy)")
-        item.setData(Qt.Qt.UserRole, DataType.MUSIC_TRACK_SAPPY)
-        item.setIcon(ui_styles.getIcon(DataType.MUSIC_TRACK_SAPPY))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Music key split table (sappy)")
-        item.setData(Qt.Qt.UserRole, DataType.MUSIC_KEY_SPLIT_TABLE_SAPPY)
-        item.setIcon(ui_styles.getIcon(DataType.MUSIC_KEY_SPLIT_TABLE_SAPPY))
-        self.addItem(item)
-
-        item = Qt.QListWidgetItem()
-        item.setText(f"Unknown")
-        item.setData(Qt.Qt.UserRole, DataType.UNKNOWN)
-        item.setIcon(ui_styles.getIcon(DataType.UNKNOWN))
-        self.addItem(item)
-
-        rect = self.visualItemRect(item)
-        self.setMinimumHeight(rect.height() * self.count() + 4)
-        self.setMaximumHeight(rect.height() * self.count() + 4)
+        # Items are uniform, so a single row is enough to measure them
+        self.setFixedHeight(self.sizeHintForRow(0) * self.count() + 4)
 
         self.itemSelectionChanged.connect(self._onItemSelectionChanged)
 
@@ -113,11 +62,10 @@ class DataTypeList(Qt.QListWidget):
     def _findItemFromValue(self, value: DataType | None) -> Qt.QListWidgetItem | None:
         if value is None:
             return None
-        for i in range(self.count()):
-            item = self.item(i)
-            if item.data(Qt.Qt.UserRole) == value:
-                return item
-        return None
+        row = self.__rowByValue.get(value)
+        if row is None:
+            return None
+        return self.item(row)
 
     def selectValue(self, value: DataType | None):
         item = self._findItemFromValue(value)
@@ -1,5 +1,6 @@
+from __future__ import annotations
 import os
-import io
+import lru
 import numpy
 import typing
 from PyQt5 import Qt
@@ -64,6 +65,40 @@ DESCRIPTION = {
 }
 
 
+_PARSE_CACHE: lru.LRU[tuple[DataType, bytes], list[tuple[int, bytes, str]]] = lru.LRU(512)
+
+
+def _parseStruct(dataType: DataType, struct: typing.Any, data: bytes) -> list[tuple[int, bytes, str]]:
+    """Memoized `struct.parse_struct`, the same bytes are often parsed again"""
+    key = (dataType, data)
+    result = _PARSE_CACHE.get(key, None)
+    if result is None:
+        result = struct.parse_struct(data)
+        _PARSE_CACHE[key] = result
+    return result
+
+
+_SHORT_DESCRIPTIONS_CACHE: lru.LRU[tuple[DataType, bytes], list[str]] = lru.LRU(16)
+
+
+def _shortDescriptions(dataType: DataType, data: bytes) -> list[str]:
+    """Short description of each item of a sappy table.
+
+    Memoized, browsing back to an already displayed table reuses them.
+    """
+    key = (dataType, data)
+    result = _SHORT_DESCRIPTIONS_CACHE.get(key, None)
+    if result is None:
+        if dataType == DataType.MUSIC_SONG_TABLE_SAPPY:
+            result = sappy_utils.SongTableItem.parse_short_descriptions(data)
+        elif dataType == DataType.MUSIC_INSTRUMENT_SAPPY:
+            result = sappy_utils.InstrumentItem.parse_short_descriptions(data)
+        else:
+            result = []
+        _SHORT_DESCRIPTIONS_CACHE[key] = result
+    return result
+
+
 class DataView(Qt.QWidget):
     """
     Display most of the known data with the best we can have.
@@ -78,6 +113,7 @@ class DataView(Qt.QWidget):
         self.__context: Context | None = None
         self.__memoryMap: MemoryMap | None = None
         self.__rom: GBAFile | None = None
+        self.__itemDescriptions: list[str] = []
 
         self.setFocusPolicy(Qt.Qt.StrongFocus)
 
@@ -193,7 +229,7 @@ class DataView(Qt.QWidget):
         if desc.item_struct is None:
             self.__hexaStruct.setStruct(None)
             return
-        dataStruct = desc.item_struct.parse_struct(data)
+        dataStruct = _parseStruct(dataType, desc.item_struct, data)
         self.__hexaStruct.setStruct(dataStruct, address)
 
     def memoryMap(self) -> MemoryMap | None:
@@ -215,19 +251,14 @@ class DataView(Qt.QWidget):
         self.__rom = rom
         self._updateData()
 
-    def __instrumentDescription(self, row: int, data: bytes) -> str:
-        inst = sappy_utils.InstrumentItem.parse(data)
-        return inst.short_description
-
-    def __songDescription(self, row: int, data: bytes) -> str:
-        songAddress = sappy_utils.SongTableItem.parse(data)
-        return songAddress.short_description
+    def __itemDescription(self, row: int, data: bytes) -> str:
+        return self.__itemDescriptions[row]
 
     def _updateData(self):
         rom = self.__rom
         mem = self.__memoryMap
         if rom is None or mem is None:
-            self.__table.setMemory(io.BytesIO(b""))
+            self.__table.setMemory(None)
             return
 
         data = rom.extract_data(mem)
@@ -242,13 +273,13 @@ class DataView(Qt.QWidget):
             self.__table.setVisible(True)
             self.__hexaStruct.setVisible(False)
         elif desc.is_array:
+            # Descriptions of the whole table are computed at once
+            self.__itemDescriptions = _shortDescriptions(dataType, data)
             self.__table.setVisible(True)
-            self.__table.setMemory(io.BytesIO(data), address=mem.byte_offset)
+            self.__table.setMemory(data, address=mem.byte_offset)
             model.setItemSize(desc.item_size)
-            if dataType == DataType.MUSIC_SONG_TABLE_SAPPY:
-                model.setDescriptionMethod(self.__songDescription)
-            elif dataType == DataType.MUSIC_INSTRUMENT_SAPPY:
-                model.setDescriptionMethod(self.__instrumentDescription)
+            if self.__itemDescriptions:
+                model.setDescriptionMethod(self.__itemDescription)
             else:
                 model.setDescriptionMethod(None)
             self.__hexaStruct.setVisible(True)
@@ -256,7 +287,7 @@ class DataView(Qt.QWidget):
         else:
             if dataType == DataType.MUSIC_SONG_HEADER_SAPPY:
                 self.__searchSongHeaderAddress.setAddress(mem.byte_offset)
-            dataStruct = desc.struct.parse_struct(data)
+            dataStruct = _parseStruct(dataType, desc.struct, data)
             self.__table.setVisible(False)
             self.__hexaStruct.setVisible(True)
             self.__hexaStruct.setStruct(dataStruct, address=mem.byte_offset)
@@ -2,7 +2,12 @@ from __future__ import annotations
 import io
 import lru
 from PyQt5 import Qt
-from typing import Callable
+from typing import Any, Callable
+from ..format_utils import BYTE_HEX
+
+
+# Above this amount of computed descriptions the cache is dropped
+_MAX_CACHED_DESCRIPTIONS = 200_000
 
 
 class HexaTableModel(Qt.QAbstractTableModel):
@@ -28,8 +33,24 @@ class HexaTableModel(Qt.QAbstractTableModel):
         self.__length: int = 0
         self.__font = Qt.QFontDatabase.systemFont(Qt.QFontDatabase.FixedFont)
         self.__palette = Qt.QPalette()
-        self.__description: lru.LRU[int, str] = lru.LRU(256)
+        self.__descriptionBackground = self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.Window)
+        self.__outOfRangeBackground = self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.ButtonText)
+        self.__descriptionForeground = Qt.QColorConstants.Black
+        # Description per row, None if not yet computed
+        self.__description: list[str | None] = []
+        self.__nbDescriptions: int = 0
+        self.__rowAddress: lru.LRU[int, str] = lru.LRU(1024)
         self.__descriptionMeth: Callable[[int, bytes], str] | None = None
+        self.__roleHandlers: dict[int, Callable[[int, int], Any]] = {
+            self.AddressRole: self._addressData,
+            self.ItemAddressRole: self._itemAddressData,
+            self.ItemData: self._itemData,
+            Qt.Qt.DisplayRole: self._displayData,
+            Qt.Qt.FontRole: self._fontData,
+            Qt.Qt.ForegroundRole: self._foregroundData,
+            Qt.Qt.BackgroundRole: self._backgroundData,
+            Qt.Qt.TextAlignmentRole: self._textAlignmentData,
+        }
 
     def itemSize(self) -> int:
         return self.__itemSize
@@ -37,6 +58,8 @@ class HexaTableModel(Qt.QAbstractTableModel):
     def setItemSize(self, itemSize: int):
         self.beginResetModel()
         self.__itemSize = itemSize
+        self._clearDescriptions()
+        self.__rowAddress.clear()
         self.endResetModel()
 
     def rowCount(self, parent_idx=None):
@@ -51,9 +74,9 @@ class HexaTableModel(Qt.QAbstractTableModel):
         return self.__itemSize + 1
 
     def _getCachedDescription(self, row: int) -> str:
-        ascii = self.__description.get(row, None)
-        if ascii is not None:
-            return ascii
+        text = self.__description[row]
+        if text is not None:
+            return text
 
         if self.__data is None:
             text = "No data"
@@ -64,13 +87,20 @@ class HexaTableModel(Qt.QAbstractTableModel):
             else:
                 data = self.__data[start:start + self.__itemSize]
                 text = self._getDescription(row, data)
+        if self.__nbDescriptions >= _MAX_CACHED_DESCRIPTIONS:
+            self._clearDescriptions()
         self.__description[row] = text
+        self.__nbDescriptions += 1
         return text
 
+    def _clearDescriptions(self):
+        self.__description = [None] * self.rowCount()
+        self.__nbDescriptions = 0
+
     def setDescriptionMethod(self, meth: Callable[[int, bytes], str] | None):
         self.beginResetModel()
         self.__descriptionMeth = meth
-        self.__description.clear()
+        self._clearDescriptions()
         self.endResetModel()
 
     def _getDescription(self, row: int, data: bytes) -> str:
@@ -84,71 +114,71 @@ class HexaTableModel(Qt.QAbstractTableModel):
     def data(self, index: Qt.QModelIndex, role=Qt.Qt.DisplayRole):
         """QAbstractTableModel method to access data values
         in the format ready to be displayed"""
+        handler = self.__roleHandlers.get(role)
+        if handler is None:
+            return None
+
         if not index.isValid():
             return None
 
         if self.__data is None:
             return None
 
-        row = index.row()
-        column = index.column()
-
-        if role == self.AddressRole:
-            pos = (row * self.__itemSize) + column
-            if pos > self.__length:
-                return None
-            return self.__address + pos
-
-        elif role == self.ItemAddressRole:
-            pos = (row * self.__itemSize) + column
-            if pos > self.__length:
-                return None
-            return self.__address + row * self.__itemSize
+        return handler(index.row(), index.column())
 
-        elif role == self.ItemData:
-            start = (row * self.__itemSize)
-            if start + self.__itemSize > self.__length:
-                return None
-            return self.__data[start:start + self.__itemSize]
+    def _addressData(self, row: int, column: int):
+        pos = (row * self.__itemSize) + column
+        if pos > self.__length:
+            return None
+        return self.__address + pos
 
-        elif role == Qt.Qt.DisplayRole:
-            if column == self.__itemSize:
-                return self._getCachedDescription(row)
-            else:
-                pos = (row * self.__itemSize) + column
-                if pos < self.__length:
-                    value = self.__data[pos]
-                    return f"{value:02X}"
-                else:
-                    return ""
+    def _itemAddressData(self, row: int, column: int):
+        itemSize = self.__itemSize
+        pos = (row * itemSize) + column
+        if pos > self.__length:
+            return None
+        return self.__address + row * itemSize
 
-        elif role == Qt.Qt.FontRole:
-            if column < self.__itemSize:
-                return self.__font
-            else:
-                return None
-
-        elif role == Qt.Qt.ForegroundRole:
-            if column == self.__itemSize:
-                return Qt.QColorConstants.Black
-
-        elif role == Qt.Qt.BackgroundRole:
-            pos = (row * self.__itemSize) + column
-            if column == self.__itemSize:
-                return self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.Window)
-            elif pos >= self.__length:
-                return self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.ButtonText)
-            else:
-                return None
+    def _itemData(self, row: int, column: int):
+        itemSize = self.__itemSize
+        start = row * itemSize
+        if start + itemSize > self.__length:
+            return None
+        return self.__data[start:start + itemSize]
+
+    def _displayData(self, row: int, column: int):
+        itemSize = self.__itemSize
+        if column == itemSize:
+            return self._getCachedDescription(row)
+        pos = (row * itemSize) + column
+        if pos < self.__length:
+            return BYTE_HEX[self.__data[pos]]
+        return ""
+
+    def _fontData(self, row: int, column: int):
+        if column < self.__itemSize:
+            return self.__font
+        return None
 
-        elif role == Qt.Qt.TextAlignmentRole:
-            if column == self.__itemSize:
-                return Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
-            else:
-                return Qt.Qt.AlignCenter
+    def _foregroundData(self, row: int, column: int):
+        if column == self.__itemSize:
+            return self.__descriptionForeground
+        return None
 
+    def _backgroundData(self, row: int, column: int):
+        itemSize = self.__itemSize
+        if column == itemSize:
+            return self.__descriptionBackground
+        pos = (row * itemSize) + column
+        if pos >= self.__length:
+            return self.__outOfRangeBackground
         return None
 
+    def _textAlignmentData(self, row: int, column: int):
+        if column == self.__itemSize:
+            return Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
+        return Qt.Qt.AlignCenter
+
     def headerData(self, section, orientation, role=Qt.Qt.DisplayRole):
         """Returns the 0-based row or column index, for display in the
         horizontal and vertical headers"""
@@ -158,11 +188,17 @@ class HexaTableModel(Qt.QAbstractTableModel):
 
         if role == Qt.Qt.DisplayRole:
             if orientation == Qt.Qt.Vertical:
-                address = self.__address + (section * self.__itemSize)
-                return f"{address:08X}"
+                text = self.__rowAddress.get(section, None)
+                if text is None:
+                    address = self.__address + (section * self.__itemSize)
+                    text = f"{address:08X}"
+                    self.__rowAddress[section] = text
+                return text
             if orientation == Qt.Qt.Horizontal:
                 if section == self.__itemSize:
                     return "Description"
+                elif section < 256:
+                    return BYTE_HEX[section]
                 else:
                     return f"{section:02X}"
         elif role == Qt.Qt.FontRole:
@@ -202,7 +238,8 @@ class HexaTableModel(Qt.QAbstractTableModel):
         self.__data = data
         self.__address = address
         self.__length = len(data) if data is not None else 0
-        self.__description.clear()
+        self._clearDescriptions()
+        self.__rowAddress.clear()
         self.endResetModel()
 
     def indexFromAddress(self, address: int) -> Qt.QModelIndex:
@@ -230,6 +267,22 @@ class HexaArrayView(Qt.QTableView):
         Qt.QTableView.__init__(self, parent)
         model = HexaTableModel(self)
         self.setModel(model)
+        # Cache of the single selected index, None if not yet computed
+        self.__selectedIndex: Qt.QModelIndex | None = None
+        self.selectionModel().selectionChanged.connect(self.__invalidateSelectedIndex)
+        model.modelReset.connect(self.__invalidateSelectedIndex)
+
+    def __invalidateSelectedIndex(self):
+        self.__selectedIndex = None
+
+    def _singleSelectedIndex(self) -> Qt.QModelIndex | None:
+        """Returns the selected index if there is exactly one"""
+        index = self.__selectedIndex
+        if index is None:
+            items = self.selectionModel().selectedIndexes()
+            index = items[0] if len(items) == 1 else Qt.QModelIndex()
+            self.__selectedIndex = index
+        return index if index.isValid() else None
 
     def setPosition(self, pos: int):
         line = pos // 16
@@ -237,15 +290,19 @@ class HexaArrayView(Qt.QTableView):
         index = model.index(line, 0)
         self.scrollTo(index)
 
-    def setMemory(self, memory: io.IOBase | None, address: int=0):
+    def setMemory(self, memory: bytes | io.IOBase | None, address: int=0):
         """
         Set the binary data.
+
+        Bytes are used as it is, without any wrapping.
         """
-        if memory is not None:
+        if memory is None:
+            data = b""
+        elif isinstance(memory, bytes):
+            data = memory
+        else:
             # FIXME: Really handle `io`, actually we only support `BytesIO`.
             data = memory.getvalue()
-        else:
-            data = b""
         self.model().setBytes(data, address=address)
         self.__fixHeader()
 
@@ -257,29 +314,23 @@ class HexaArrayView(Qt.QTableView):
 
     def selectedAddress(self) -> int | None:
         """Return the selected address"""
-        model = self.selectionModel()
-        items = model.selectedIndexes()
-        if len(items) != 1:
+        index = self._singleSelectedIndex()
+        if index is None:
             return None
-        index = items[0]
         return index.data(HexaTableModel.AddressRole)
 
     def selectedItemAddress(self) -> int | None:
         """Return the selected address"""
-        model = self.selectionModel()
-        items = model.selectedIndexes()
-        if len(items) != 1:
+        index = self._singleSelectedIndex()
+        if index is None:
             return None
-        index = items[0]
         return index.data(HexaTableModel.ItemAddressRole)
 
     def selectedItemData(self) -> bytes | None:
         """Return the selected address"""
-        model = self.selectionModel()
-        items = model.selectedIndexes()
-        if len(items) != 1:
+        index = self._singleSelectedIndex()
+        if index is None:
             return None
-        index = items[0]
         return index.data(HexaTableModel.ItemData)
 
     def selectAddress(self, address: int | None):
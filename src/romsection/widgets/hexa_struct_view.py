@@ -2,7 +2,8 @@ from __future__ import annotations
 import io
 import lru
 from PyQt5 import Qt
-from typing import Callable
+from typing import Any, Callable
+from ..format_utils import BYTE_HEX
 
 
 class HexaStructModel(Qt.QAbstractTableModel):
@@ -18,6 +19,16 @@ class HexaStructModel(Qt.QAbstractTableModel):
         self.__itemSize: int = 0
         self.__font = Qt.QFontDatabase.systemFont(Qt.QFontDatabase.FixedFont)
         self.__palette = Qt.QPalette()
+        self.__descriptionBackground = self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.Window)
+        self.__outOfRangeBackground = self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.ButtonText)
+        self.__descriptionForeground = Qt.QColorConstants.Black
+        self.__roleHandlers: dict[int, Callable[[tuple[int, bytes, str], int, bool], Any]] = {
+            Qt.Qt.DisplayRole: self._displayData,
+            Qt.Qt.FontRole: self._fontData,
+            Qt.Qt.ForegroundRole: self._foregroundData,
+            Qt.Qt.BackgroundRole: self._backgroundData,
+            Qt.Qt.TextAlignmentRole: self._textAlignmentData,
+        }
 
     def rowCount(self, parent_idx=None):
         """Returns number of rows to be displayed in table"""
@@ -30,50 +41,45 @@ class HexaStructModel(Qt.QAbstractTableModel):
     def data(self, index: Qt.QModelIndex, role=Qt.Qt.DisplayRole):
         """QAbstractTableModel method to access data values
         in the format ready to be displayed"""
+        handler = self.__roleHandlers.get(role)
+        if handler is None:
+            return None
+
         if not index.isValid():
             return None
 
-        row = index.row()
         column = index.column()
-        dataStruct = self.__struct[row]
-
-        if role == Qt.Qt.DisplayRole:
-            if column == self.__itemSize:
-                return dataStruct[2]
-            else:
-                data = dataStruct[1]
-                if column < len(data):
-                    return f"{data[column]:02X}"
-                else:
-                    return ""
+        return handler(self.__struct[index.row()], column, column == self.__itemSize)
+
+    def _displayData(self, dataStruct: tuple[int, bytes, str], column: int, isDescription: bool):
+        if isDescription:
+            return dataStruct[2]
+        data = dataStruct[1]
+        if column < len(data):
+            return BYTE_HEX[data[column]]
+        return ""
+
+    def _fontData(self, dataStruct: tuple[int, bytes, str], column: int, isDescription: bool):
+        if column < self.__itemSize:
+            return self.__font
+        return None
 
-        elif role == Qt.Qt.FontRole:
-            if column < self.__itemSize:
-                return self.__font
-            else:
-                return None
-
-        elif role == Qt.Qt.ForegroundRole:
-            if column == self.__itemSize:
-                return Qt.QColorConstants.Black
-
-        elif role == Qt.Qt.BackgroundRole:
-            if column == self.__itemSize:
-                return self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.Window)
-            else:
-                data = dataStruct[1]
-                if column < len(data):
-                    return None
-                else:
-                    return self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.ButtonText)
+    def _foregroundData(self, dataStruct: tuple[int, bytes, str], column: int, isDescription: bool):
+        if isDescription:
+            return self.__descriptionForeground
+        return None
 
-        elif role == Qt.Qt.TextAlignmentRole:
-            if column == self.__itemSize:
-                return Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
-            else:
-                return Qt.Qt.AlignCenter
+    def _backgroundData(self, dataStruct: tuple[int, bytes, str], column: int, isDescription: bool):
+        if isDescription:
+            return self.__descriptionBackground
+        if column < len(dataStruct[1]):
+            return None
+        return self.__outOfRangeBackground
 
-        return None
+    def _textAlignmentData(self, dataStruct: tuple[int, bytes, str], column: int, isDescription: bool):
+        if isDescription:
+            return Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
+        return Qt.Qt.AlignCenter
 
     def headerData(self, section, orientation, role=Qt.Qt.DisplayRole):
         """Returns the 0-based row or column index, for display in the
@@ -90,6 +96,8 @@ class HexaStructModel(Qt.QAbstractTableModel):
             if orientation == Qt.Qt.Horizontal:
                 if section == self.__itemSize:
                     return "Description"
+                elif section < 256:
+                    return BYTE_HEX[section]
                 else:
                     return f"{section:02X}"
         elif role == Qt.Qt.FontRole:
@@ -124,15 +132,29 @@ class HexaStructModel(Qt.QAbstractTableModel):
         return Qt.QAbstractTableModel.flags(self, index)
 
     def setStruct(self, data: list[tuple[int, bytes, str]], address: int = 0):
+        if data != [] and self.__sameLayout(data):
+            # Keep the rows, only the content changes
+            self.__address = address
+            self.__struct = data
+            lastRow = len(data) - 1
+            self.dataChanged.emit(self.index(0, 0), self.index(lastRow, self.__itemSize))
+            self.headerDataChanged.emit(Qt.Qt.Vertical, 0, lastRow)
+            return
         self.beginResetModel()
         self.__address = address
         self.__struct = data
-        if self.__struct != []:
-            self.__itemSize = max([len(s[1]) for s in self.__struct])
-        else:
-            self.__itemSize = 0
+        self.__itemSize = max((len(s[1]) for s in data), default=0)
         self.endResetModel()
 
+    def __sameLayout(self, data: list[tuple[int, bytes, str]]) -> bool:
+        """True if the data can be displayed without changing rows and columns"""
+        if len(data) != len(self.__struct):
+            return False
+        for current, new in zip(self.__struct, data):
+            if len(current[1]) != len(new[1]):
+                return False
+        return True
+
 
 class HexaStructView(Qt.QTableView):
     """
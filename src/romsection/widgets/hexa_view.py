@@ -1,7 +1,16 @@
 from __future__ import annotations
 import io
 import lru
+from typing import Any, Callable
 from PyQt5 import Qt
+from ..format_utils import BYTE_HEX
+
+
+# Printable ASCII characters are kept, everything else is displayed as a dot
+_ASCII_TABLE = bytes(i if 0x20 < i < 0x7F else 0x2E for i in range(256))
+
+# Non-zero for the values of 4-bytes aligned bytes which are highlighted
+_HILIGHT_TABLE = bytes(int(i in (0x10, 0x24, 0x28, 0x30)) for i in range(256))
 
 
 class HexaTableModel(Qt.QAbstractTableModel):
@@ -22,8 +31,27 @@ class HexaTableModel(Qt.QAbstractTableModel):
         self.__padding: int = 0
         self.__font = Qt.QFontDatabase.systemFont(Qt.QFontDatabase.FixedFont)
         self.__palette = Qt.QPalette()
+        self.__asciiBackground = self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.Window)
+        self.__outOfRangeBackground = self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.ButtonText)
+        self.__asciiForeground = Qt.QColorConstants.Black
+        self.__alignLeft = Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
+        self.__alignRight = Qt.Qt.AlignRight | Qt.Qt.AlignVCenter
         self.__ascii: lru.LRU[int, str] = lru.LRU(256)
+        self.__rowAddress: lru.LRU[int, str] = lru.LRU(1024)
         self.__hilight = Qt.QColor("#fcaf3e")
+        # One byte per 4-bytes aligned position, non-zero if highlighted.
+        # None if not yet computed.
+        self.__hilightWords: bytes | None = None
+        # First 4-bytes aligned position of the data
+        self.__hilightOrigin: int = 0
+        self.__roleHandlers: dict[int, Callable[[int, int], Any]] = {
+            Qt.Qt.UserRole: self._addressData,
+            Qt.Qt.ForegroundRole: self._foregroundData,
+            Qt.Qt.DisplayRole: self._displayData,
+            Qt.Qt.FontRole: self._fontData,
+            Qt.Qt.BackgroundRole: self._backgroundData,
+            Qt.Qt.TextAlignmentRole: self._textAlignmentData,
+        }
 
     def rowCount(self, parent_idx=None):
         """Returns number of rows to be displayed in table"""
@@ -44,19 +72,15 @@ class HexaTableModel(Qt.QAbstractTableModel):
             return ascii
 
         start = row << 4
-        text = ""
-        for i in range(0x10):
-            pos = start + i
-            if pos >= self.__length:
-                break
-            if pos < self.__padding:
-                text += " "
-                continue
-            value = self.__data[pos - self.__padding]
-            if value > 0x20 and value < 0x7F:
-                text += chr(value)
-            else:
-                text += "."
+        end = min(start + 0x10, self.__length)
+        dataStart = start - self.__padding
+        if dataStart < 0:
+            prefix = " " * min(-dataStart, end - start)
+            dataStart = 0
+        else:
+            prefix = ""
+        data = self.__data[dataStart:end - self.__padding]
+        text = prefix + data.translate(_ASCII_TABLE).decode("ascii")
 
         self.__ascii[row] = text
         return text
@@ -64,68 +88,74 @@ class HexaTableModel(Qt.QAbstractTableModel):
     def data(self, index, role=Qt.Qt.DisplayRole):
         """QAbstractTableModel method to access data values
         in the format ready to be displayed"""
+        handler = self.__roleHandlers.get(role)
+        if handler is None:
+            return None
+
         if not index.isValid():
             return None
 
         if self.__data is None:
             return None
 
-        row = index.row()
-        column = index.column()
-
-        if role == Qt.Qt.UserRole:
-            if column == 0x10:
-                return None
-            pos = (row << 4) + column
-            if pos < self.__padding:
-                return None
-            if pos < self.__length:
-                return self.__start + pos
-            else:
-                return None
+        return handler(index.row(), index.column())
 
-        elif role == Qt.Qt.ForegroundRole:
-            if column == 0x10:
-                return Qt.QColorConstants.Black
+    def _resolvePos(self, row: int, column: int) -> int | None:
+        """Returns the offset in the data of the byte displayed at this
+        hexadecimal cell, else None for padding and out of range cells"""
+        pos = (row << 4) + column
+        padding = self.__padding
+        if padding <= pos < self.__length:
+            return pos - padding
+        return None
 
-        elif role == Qt.Qt.DisplayRole:
-            if column == 0x10:
-                ascii = self._getAscii(row)
-                return ascii
-            else:
-                pos = (row << 4) + column
-                if pos < self.__padding:
-                    return ""
-                if pos < self.__length:
-                    value = self.__data[pos - self.__padding]
-                    return f"{value:02X}"
-                else:
-                    return ""
-        elif role == Qt.Qt.FontRole:
-            return self.__font
+    def _addressData(self, row: int, column: int):
+        if column == 0x10:
+            return None
+        offset = self._resolvePos(row, column)
+        if offset is None:
+            return None
+        return self.__address + offset
 
-        elif role == Qt.Qt.BackgroundRole:
-            if column == 0x10:
-                return self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.Window)
-            pos = (row << 4) + column
-            if pos < self.__padding or pos >= self.__length:
-                return self.__palette.color(Qt.QPalette.Disabled, Qt.QPalette.ButtonText)
+    def _foregroundData(self, row: int, column: int):
+        if column == 0x10:
+            return self.__asciiForeground
+        return None
 
-            if pos % 4 == 0:
-                value = self.__data[pos - self.__padding]
-                if value in (0x10, 0x24, 0x28, 0x30):
-                    return self.__hilight
+    def _displayData(self, row: int, column: int):
+        if column == 0x10:
+            return self._getAscii(row)
+        offset = self._resolvePos(row, column)
+        if offset is None:
+            return ""
+        return BYTE_HEX[self.__data[offset]]
 
-            return None
+    def _fontData(self, row: int, column: int):
+        return self.__font
 
-        elif role == Qt.Qt.TextAlignmentRole:
-            if column == 0x10:
-                return Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
-            else:
-                return Qt.Qt.AlignCenter
+    def _backgroundData(self, row: int, column: int):
+        if column == 0x10:
+            return self.__asciiBackground
+        offset = self._resolvePos(row, column)
+        if offset is None:
+            return self.__outOfRangeBackground
+
+        pos = offset + self.__padding
+        if pos & 3 == 0:
+            hilightWords = self.__hilightWords
+            if hilightWords is None:
+                hilightWords = self._computeHilight()
+            if hilightWords[(pos - self.__hilightOrigin) >> 2]:
+                return self.__hilight
 
         return None
 
+    def _textAlignmentData(self, row: int, column: int):
+        if column == 0x10:
+            return self.__alignLeft
+        else:
+            return Qt.Qt.AlignCenter
+
     def headerData(self, section, orientation, role=Qt.Qt.DisplayRole):
         """Returns the 0-based row or column index, for display in the
         horizontal and vertical headers"""
@@ -135,21 +165,25 @@ class HexaTableModel(Qt.QAbstractTableModel):
 
         if role == Qt.Qt.DisplayRole:
             if orientation == Qt.Qt.Vertical:
-                address = self.__start + (section << 4)
-                return f"{address:08X}"
+                text = self.__rowAddress.get(section, None)
+                if text is None:
+                    address = self.__start + (section << 4)
+                    text = f"{address:08X}"
+                    self.__rowAddress[section] = text
+                return text
             if orientation == Qt.Qt.Horizontal:
                 if section == 0x10:
                     return "ASCII"
                 else:
-                    return f"{section:02X}"
+                    return BYTE_HEX[section]
         elif role == Qt.Qt.FontRole:
             return self.__font
         elif role == Qt.Qt.TextAlignmentRole:
             if orientation == Qt.Qt.Vertical:
-                return Qt.Qt.AlignRight | Qt.Qt.AlignVCenter
+                return self.__alignRight
             if orientation == Qt.Qt.Horizontal:
                 if section == 0x10:
-                    return Qt.Qt.AlignLeft | Qt.Qt.AlignVCenter
+                    return self.__alignLeft
                 else:
                     return Qt.Qt.AlignCenter
         return None
@@ -161,15 +195,27 @@ class HexaTableModel(Qt.QAbstractTableModel):
         column = index.column()
         if column == 0x10:
             return Qt.Qt.NoItemFlags
-        row = index.row()
-        pos = (row << 4) + column
-        if pos < self.__padding or pos >= self.__length:
+        if self._resolvePos(index.row(), column) is None:
             return Qt.Qt.NoItemFlags
         return Qt.QAbstractTableModel.flags(self, index)
 
     def setBytes(self, data: bytes | None, address: int = 0):
-        """Set the data array."""
-        self.beginResetModel()
+        """Set the data array.
+
+        If the rows and the padding are the same, the cells are only
+        updated, else the model is reset.
+        """
+        rowCount = self.rowCount()
+        padding = self.__padding
+        sameLayout = False
+        if self.__data is not None and data is not None and rowCount > 0:
+            sameLayout = (
+                address & 0xF == padding
+                and ((padding + len(data) - 1) >> 4) + 1 == rowCount
+            )
+        if not sameLayout:
+            self.beginResetModel()
+
         self.__data = data
         self.__address = address
         self.__start = (address >> 4) << 4
@@ -179,13 +225,36 @@ class HexaTableModel(Qt.QAbstractTableModel):
         else:
             self.__length = 0
         self.__ascii.clear()
-        self.endResetModel()
+        self.__rowAddress.clear()
+        self.__hilightWords = None
+
+        if sameLayout:
+            lastRow = rowCount - 1
+            self.dataChanged.emit(self.index(0, 0), self.index(lastRow, 0x10))
+            self.headerDataChanged.emit(Qt.Qt.Vertical, 0, lastRow)
+        else:
+            self.endResetModel()
+
+    def _computeHilight(self) -> bytes:
+        """Compute at once the highlighted 4-bytes aligned positions"""
+        assert self.__data is not None
+        first = -self.__padding % 4
+        self.__hilightOrigin = self.__padding + first
+        hilightWords = self.__data[first::4].translate(_HILIGHT_TABLE)
+        self.__hilightWords = hilightWords
+        return hilightWords
 
     def indexFromAddress(self, address: int) -> Qt.QModelIndex:
-        if address < self.__address or address >= self.__address + self.__length:
+        if not self.__address <= address < self.__start + self.__length:
             return Qt.QModelIndex()
-        row, col = divmod(address - self.__start, 16)
-        return self.index(row, col)
+        pos = address - self.__start
+        return self.index(pos >> 4, pos & 0xF)
+
+    def addressFromIndex(self, index: Qt.QModelIndex) -> int | None:
+        """Returns the address of the byte displayed at this index"""
+        if not index.isValid() or self.__data is None:
+            return None
+        return self._addressData(index.row(), index.column())
 
     def bytes(self) -> bytes | None:
         """Returns the internal data."""
@@ -218,15 +287,20 @@ class HexaView(Qt.QTableView):
             data = memory.getvalue()
         else:
             data = b""
-        self.model().setBytes(data, address=address)
-        self.__fixHeader()
+        self.__setBytes(data, address)
 
     def setData(self, data: bytes | None, address: int=0):
         """Set the binary data.
 
         FIXME: Deprecated
         """
+        self.__setBytes(data, address)
+
+    def __setBytes(self, data: bytes | None, address: int):
         self.model().setBytes(data, address=address)
+        # The model is not always reset, but the selection is not relevant
+        # anymore. Like a reset, this is done without notification.
+        self.selectionModel().reset()
         self.__fixHeader()
 
     def __fixHeader(self):
@@ -248,7 +322,7 @@ class HexaView(Qt.QTableView):
         items = model.selectedIndexes()
         if len(items) != 1:
             return None
-        return items[0].data(Qt.Qt.UserRole)
+        return self.model().addressFromIndex(items[0])
 
     def selectAddress(self, address: int | None):
         """Set the selected address"""
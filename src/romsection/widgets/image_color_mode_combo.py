@@ -13,6 +13,9 @@ class ImageColorModeCombo(Qt.QComboBox):
         self.addItem("Indexed 16 colors", ImageColorMode.INDEXED_4BIT)
         self.addItem("ARGB 1+5+5+5 bits", ImageColorMode.A1RGB15)
         self.addItem("RGB 5+5+5 bits", ImageColorMode.RGB15)
+        self.__indexByValue: dict[ImageColorMode, int] = {
+            self.itemData(index): index for index in range(self.count())
+        }
         self.setCurrentIndex(0)
         self.currentIndexChanged.connect(self.__onCurrentIndexChanged)
 
@@ -30,8 +33,4 @@ class ImageColorModeCombo(Qt.QComboBox):
         if colorMode is None:
             self.setCurrentIndex(-1)
             return
-        for index in range(self.count()):
-            if  self.itemData(index) == colorMode:
-                self.setCurrentIndex(index)
-                return
-        self.setCurrentIndex(-1)
+        self.setCurrentIndex(self.__indexByValue.get(colorMode, -1))
@@ -14,14 +14,18 @@ class ImageColorModeList(Qt.QListWidget):
         self.setSizePolicy(Qt.QSizePolicy.Expanding, Qt.QSizePolicy.Maximum)
         self.setSizeAdjustPolicy(Qt.QListWidget.AdjustToContents)
 
+        self.__rowByValue: dict[ImageColorMode, int] = {}
+
         item = Qt.QListWidgetItem()
         item.setText(f"Indexed 256 colors")
         item.setData(Qt.Qt.UserRole, ImageColorMode.INDEXED_8BIT)
+        self.__rowByValue[ImageColorMode.INDEXED_8BIT] = self.count()
         self.addItem(item)
 
         item = Qt.QListWidgetItem()
         item.setText(f"Indexed 16 colors")
         item.setData(Qt.Qt.UserRole, ImageColorMode.INDEXED_4BIT)
+        self.__rowByValue[ImageColorMode.INDEXED_4BIT] = self.count()
         self.addItem(item)
 
         rect = self.visualItemRect(item)
@@ -43,11 +47,10 @@ class ImageColorModeList(Qt.QListWidget):
     def _findItemFromValue(self, value: ImageColorMode | None) -> Qt.QListWidgetItem | None:
         if value is None:
             return None
-        for i in range(self.count()):
-            item = self.item(i)
-            if item.data(Qt.Qt.UserRole) == value:
-                return item
-        return None
+        row = self.__rowByValue.get(value)
+        if row is None:
+            return None
+        return self.item(row)
 
     def selectValue(self, value: ImageColorMode | None):
         item = self._findItemFromValue(value)
@@ -11,6 +11,9 @@ class ImagePixelOrderCombo(Qt.QComboBox):
         Qt.QComboBox.__init__(self, parent)
         self.addItem("Normal", ImagePixelOrder.NORMAL)
         self.addItem("Tiled 8×8", ImagePixelOrder.TILED_8X8)
+        self.__indexByValue: dict[ImagePixelOrder, int] = {
+            self.itemData(index): index for index in range(self.count())
+        }
         self.setCurrentIndex(0)
         self.currentIndexChanged.connect(self.__onCurrentIndexChanged)
 
@@ -28,8 +31,4 @@ class ImagePixelOrderCombo(Qt.QComboBox):
         if pixelOrder is None:
             self.setCurrentIndex(-1)
             return
-        for index in range(self.count()):
-            if  self.itemData(index) == pixelOrder:
-                self.setCurrentIndex(index)
-                return
-        self.setCurrentIndex(-1)
+        self.setCurrentIndex(self.__indexByValue.get(pixelOrder, -1))
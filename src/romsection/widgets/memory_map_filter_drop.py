@@ -6,10 +6,35 @@ from . import ui_styles
 from .memory_map_proxy_model import MemoryMapFilter
 
 
+def _dataTypesPerGroup() -> dict[DataTypeGroup, frozenset[DataType]]:
+    result: dict[DataTypeGroup, set[DataType]] = {}
+    for dataType in DataType:
+        result.setdefault(dataType.value.group, set()).add(dataType)
+    return {k: frozenset(v) for k, v in result.items()}
+
+
+_DATA_TYPES_PER_GROUP = _dataTypesPerGroup()
+
+_ALL_DATA_TYPES = frozenset(DataType)
+
+
 class MemoryMapFilterDrop(Qt.QToolButton):
 
     filterChanged = Qt.pyqtSignal(object)
 
+    _DATA_TYPE_GROUPS: tuple[tuple[str, DataTypeGroup], ...] = (
+        ("Image", DataTypeGroup.IMAGE),
+        ("Tile set", DataTypeGroup.TILE_SET),
+        ("Palette", DataTypeGroup.PALETTE),
+        ("Sample", DataTypeGroup.SAMPLE),
+        ("Music", DataTypeGroup.MUSIC),
+    )
+
+    _DATA_TYPES: tuple[tuple[str, DataType], ...] = (
+        ("Padding", DataType.PADDING),
+        ("Unknown", DataType.UNKNOWN),
+    )
+
     def __init__(self, parent: Qt.QWidget | None):
         Qt.QToolButton.__init__(self, parent=parent)
         self.setPopupMode(Qt.QToolButton.InstantPopup)
@@ -17,77 +42,43 @@ class MemoryMapFilterDrop(Qt.QToolButton):
         self.__filter: MemoryMapFilter | None = None
         self.__updateIcon()
 
+        # The menu actions are created the first time the menu is shown
+        self.__dataTypeGroupActions: list[tuple[Qt.QAction, DataTypeGroup]] = []
+        self.__dataTypeActions: list[tuple[Qt.QAction, DataType]] = []
+        self.__clearAction: Qt.QAction | None = None
+
         self.__toolMenu = Qt.QMenu(self)
         self.setMenu(self.__toolMenu)
         self.__toolMenu.aboutToShow.connect(self.__menuAboutToShow)
 
     def __updateIcon(self):
         if self.__filter is None:
-            self.setIcon(Qt.QIcon("icons:filter.png"))
+            self.setIcon(ui_styles.getIconFromName("icons:filter.png"))
             self.setToolTip("Filter the memory map list")
         else:
-            self.setIcon(Qt.QIcon("icons:filter-none.png"))
+            self.setIcon(ui_styles.getIconFromName("icons:filter-none.png"))
             self.setToolTip("Filter the memory map list")
 
-    def __menuAboutToShow(self):
+    def __createMenuActions(self):
         menu = self.__toolMenu
-        menu.clear()
 
-        action = Qt.QAction(self)
-        action.setCheckable(True)
-        action.setText("Image")
-        action.setChecked(self.__isDataTypeGroupShown(DataTypeGroup.IMAGE))
-        action.triggered.connect(partial(self.__setDataTypeGroupShown, DataTypeGroup.IMAGE))
-        action.setIcon(ui_styles.getIcon(DataTypeGroup.IMAGE))
-        menu.addAction(action)
-
-        action = Qt.QAction(self)
-        action.setCheckable(True)
-        action.setText("Tile set")
-        action.setChecked(self.__isDataTypeGroupShown(DataTypeGroup.TILE_SET))
-        action.triggered.connect(partial(self.__setDataTypeGroupShown, DataTypeGroup.TILE_SET))
-        action.setIcon(ui_styles.getIcon(DataTypeGroup.TILE_SET))
-        menu.addAction(action)
-
-        action = Qt.QAction(self)
-        action.setCheckable(True)
-        action.setText("Palette")
-        action.setChecked(self.__isDataTypeGroupShown(DataTypeGroup.PALETTE))
-        action.triggered.connect(partial(self.__setDataTypeGroupShown, DataTypeGroup.PALETTE))
-        action.setIcon(ui_styles.getIcon(DataTypeGroup.PALETTE))
-        menu.addAction(action)
-
-        action = Qt.QAction(self)
-        action.setCheckable(True)
-        action.setText("Sample")
-        action.setChecked(self.__isDataTypeGroupShown(DataTypeGroup.SAMPLE))
-        action.triggered.connect(partial(self.__setDataTypeGroupShown, DataTypeGroup.SAMPLE))
-        action.setIcon(ui_styles.getIcon(DataTypeGroup.SAMPLE))
-        menu.addAction(action)
-
-        action = Qt.QAction(self)
-        action.setCheckable(True)
-        action.setText("Music")
-        action.setChecked(self.__isDataTypeGroupShown(DataTypeGroup.MUSIC))
-        action.triggered.connect(partial(self.__setDataTypeGroupShown, DataTypeGroup.MUSIC))
-        action.setIcon(ui_styles.getIcon(DataTypeGroup.MUSIC))
-        menu.addAction(action)
-
-        action = Qt.QAction(self)
-        action.setCheckable(True)
-        action.setText("Padding")
-        action.setChecked(self.__isDataTypeShown(DataType.PADDING))
-        action.triggered.connect(partial(self.__setDataTypeShown, DataType.PADDING))
-        action.setIcon(ui_styles.getIcon(DataType.PADDING))
-        menu.addAction(action)
-
-        action = Qt.QAction(self)
-        action.setCheckable(True)
-        action.setText("Unknown")
-        action.setChecked(self.__isDataTypeShown(DataType.UNKNOWN))
-        action.triggered.connect(partial(self.__setDataTypeShown, DataType.UNKNOWN))
-        action.setIcon(ui_styles.getIcon(DataType.UNKNOWN))
-        menu.addAction(action)
+        for label, dataTypeGroup in self._DATA_TYPE_GROUPS:
+            action = Qt.QAction(self)
+            action.setCheckable(True)
+            action.setText(label)
+            action.triggered.connect(partial(self.__setDataTypeGroupShown, dataTypeGroup))
+            action.setIcon(ui_styles.getIcon(dataTypeGroup))
+            menu.addAction(action)
+            self.__dataTypeGroupActions.append((action, dataTypeGroup))
+
+        for label, dataType in self._DATA_TYPES:
+            action = Qt.QAction(self)
+            action.setCheckable(True)
+            action.setText(label)
+            action.triggered.connect(partial(self.__setDataTypeShown, dataType))
+            action.setIcon(ui_styles.getIcon(dataType))
+            menu.addAction(action)
+            self.__dataTypeActions.append((action, dataType))
 
         menu.addSeparator()
 
@@ -100,11 +91,23 @@ class MemoryMapFilterDrop(Qt.QToolButton):
         menu.addSeparator()
 
         action = Qt.QAction(self)
-        action.setText("Clear filters" if self.__filter is not None else "No filters")
-        action.setEnabled(self.__filter is not None)
         action.triggered.connect(self.__clearFilter)
-        action.setIcon(Qt.QIcon("icons:clear.png"))
+        action.setIcon(ui_styles.getIconFromName("icons:clear.png"))
         menu.addAction(action)
+        self.__clearAction = action
+
+    def __menuAboutToShow(self):
+        if self.__clearAction is None:
+            self.__createMenuActions()
+
+        for action, dataTypeGroup in self.__dataTypeGroupActions:
+            action.setChecked(self.__isDataTypeGroupShown(dataTypeGroup))
+        for action, dataType in self.__dataTypeActions:
+            action.setChecked(self.__isDataTypeShown(dataType))
+
+        action = self.__clearAction
+        action.setText("Clear filters" if self.__filter is not None else "No filters")
+        action.setEnabled(self.__filter is not None)
 
     def __isDataTypeGroupShown(self, dataTypeGroup: DataTypeGroup) -> bool:
         filter = self.__filter
@@ -113,11 +116,7 @@ class MemoryMapFilterDrop(Qt.QToolButton):
         shownDataTypes = filter.shownDataTypes
         if shownDataTypes is None:
             return True
-        for dataType in DataType:
-            if dataType.value.group == dataTypeGroup:
-                if dataType in shownDataTypes:
-                    return True
-        return False
+        return not _DATA_TYPES_PER_GROUP[dataTypeGroup].isdisjoint(shownDataTypes)
 
     def __isDataTypeShown(self, dataType: DataType) -> bool:
         filter = self.__filter
@@ -128,20 +127,20 @@ class MemoryMapFilterDrop(Qt.QToolButton):
             return True
         return dataType in shownDataTypes
 
-    def __shownDataTypeSet(self) -> set[DataType]:
+    def __shownDataTypeSet(self) -> frozenset[DataType]:
         filter = self.__filter
         if filter is None:
-            return set(DataType)
+            return _ALL_DATA_TYPES
         shownDataTypes = filter.shownDataTypes
         if shownDataTypes is None:
-            return set(DataType)
-        return set(shownDataTypes)
+            return _ALL_DATA_TYPES
+        return shownDataTypes
 
     def __createMemoryMap(
         self,
-        shownDataTypes: set[DataType] | None,
+        shownDataTypes: frozenset[DataType] | None,
     ) -> MemoryMapFilter | None:
-        if shownDataTypes == set(DataType):
+        if shownDataTypes == _ALL_DATA_TYPES:
             shownDataTypes = None
         filter = self.__filter
         minBytePayload = filter.minBytePayload if filter else None
@@ -155,30 +154,24 @@ class MemoryMapFilterDrop(Qt.QToolButton):
         )
 
     def __setDataTypeGroupShown(self, dataTypeGroup: DataTypeGroup, shown: bool):
-        new = self.__shownDataTypeSet()
         if shown:
-            for dataType in DataType:
-                if dataType.value.group == dataTypeGroup:
-                    new.add(dataType)
+            new = self.__shownDataTypeSet() | _DATA_TYPES_PER_GROUP[dataTypeGroup]
         else:
-            for dataType in DataType:
-                if dataType.value.group == dataTypeGroup:
-                    new.discard(dataType)
+            new = self.__shownDataTypeSet() - _DATA_TYPES_PER_GROUP[dataTypeGroup]
         filter = self.__createMemoryMap(new)
         self.setFilter(filter)
 
     def __setDataTypeShown(self, dataType: DataType, shown: bool):
-        new = self.__shownDataTypeSet()
         if shown:
-            new.add(dataType)
+            new = self.__shownDataTypeSet() | {dataType}
         else:
-            new.discard(dataType)
+            new = self.__shownDataTypeSet() - {dataType}
         filter = self.__createMemoryMap(new)
         self.setFilter(filter)
 
     def __unknownPalettes(self):
         filter = MemoryMapFilter(
-            shownDataTypes={DataType.UNKNOWN},
+            shownDataTypes=frozenset({DataType.UNKNOWN}),
             minBytePayload=32,
             maxBytePayload=32,
         )
@@ -188,7 +181,7 @@ class MemoryMapFilterDrop(Qt.QToolButton):
         self.setFilter(None)
 
     def setFilter(self, filter: MemoryMapFilter | None):
-        if self.__filter == filter:
+        if self.__filter is filter or self.__filter == filter:
             return
         self.__filter = filter
         self.__updateIcon()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import logging
 import numpy
 import lru
@@ -10,26 +11,52 @@ from ..gba_file import MemoryMap, DataType
 from . import ui_styles
 
 
+# Roles displaying the same text
+_DISPLAY_ROLES = frozenset({Qt.Qt.DisplayRole, Qt.Qt.EditRole})
+
+
 class MemoryMapListModel(ObjectListModel):
 
+    def __init__(self, parent: Qt.QObject | None = None):
+        super().__init__(parent=parent)
+        # Sorted offsets of the memory maps, None if not yet computed
+        self.__offsets: list[int] | None = None
+        self.modelReset.connect(self.__invalidateOffsets)
+        self.rowsInserted.connect(self.__invalidateOffsets)
+        self.rowsRemoved.connect(self.__invalidateOffsets)
+        self.dataChanged.connect(self.__invalidateOffsets)
+
+    def __invalidateOffsets(self):
+        self.__offsets = None
+
     def indexAfterOffset(self, offset: int):
-        # FIXME: Use bisect instead
-        before = None
-        for row in range(self.rowCount()):
-            index = self.index(row, 0)
-            mem = self.object(index)
-            if offset < mem.byte_offset:
-                return row
-        return self.rowCount()
+        offsets = self.__offsets
+        if offsets is None:
+            offsets = [mem.byte_offset for mem in self]
+            self.__offsets = offsets
+        return bisect.bisect_right(offsets, offset)
+
+    def insertMemoryMaps(self, mems: list[MemoryMap]):
+        """Insert memory maps at their location in the sorted list.
+
+        Memory maps ending up next to each other are inserted at once.
+        """
+        groups: dict[int, list[MemoryMap]] = {}
+        for mem in sorted(mems, key=lambda m: m.byte_offset):
+            row = self.indexAfterOffset(mem.byte_offset)
+            groups.setdefault(row, []).append(mem)
+        # Insert from the end to keep the computed rows valid
+        for row in sorted(groups, reverse=True):
+            self.insertObjects(row, groups[row])
 
     def data(self, index: Qt.QModelIndex, role: int = Qt.Qt.DisplayRole):
-        if role in (Qt.Qt.DisplayRole, Qt.Qt.EditRole):
+        if role in _DISPLAY_ROLES:
             if not index.isValid():
                 return ""
             mem = self.object(index)
             if mem is None:
                 return ""
-            length = mem.byte_payload or mem.byte_length or 0
+            length = mem.byte_effective_length
             return f"{mem.byte_offset:08X} {length: 8d}B"
 
         if role == Qt.Qt.DecorationRole:
@@ -38,9 +65,6 @@ class MemoryMapListModel(ObjectListModel):
             mem = self.object(index)
             if mem is None:
                 return Qt.QIcon()
-            data_type = mem.data_type
-            if data_type is None:
-                return Qt.QIcon("icons:empty.png")
-            return ui_styles.getIcon(data_type)
+            return ui_styles.getIcon(mem.data_type)
 
         return ObjectListModel.data(self, index, role)
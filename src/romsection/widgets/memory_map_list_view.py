@@ -12,13 +12,14 @@ class MemoryMapListView(Qt.QWidget):
         self.__table = Qt.QTableView(self)
         self.__table.setIconSize(Qt.QSize(16, 16))
         self.__table.setShowGrid(False)
+        self.__table.setWordWrap(False)
         horizontalHeader = self.__table.horizontalHeader()
         horizontalHeader.hide()
         horizontalHeader.setStretchLastSection(True)
         verticalHeader = self.__table.verticalHeader()
         verticalHeader.hide()
         verticalHeader.setDefaultSectionSize(20)
-        verticalHeader.sectionResizeMode(Qt.QHeaderView.Fixed)
+        verticalHeader.setSectionResizeMode(Qt.QHeaderView.Fixed)
         self.__table.setSelectionBehavior(Qt.QAbstractItemView.SelectRows)
         self.__table.setSelectionMode(Qt.QAbstractItemView.ExtendedSelection)
 
@@ -33,6 +34,17 @@ class MemoryMapListView(Qt.QWidget):
         self.__proxy.setSourceModel(self.__columned)
         self.__table.setModel(self.__proxy)
 
+        # Memory maps of the selected rows, None if not yet computed
+        self.__selectedMemoryMaps: list[MemoryMap] | None = None
+        self.__table.selectionModel().selectionChanged.connect(self.__invalidateSelectedMemoryMaps)
+        self.__proxy.modelReset.connect(self.__invalidateSelectedMemoryMaps)
+        self.__proxy.layoutChanged.connect(self.__invalidateSelectedMemoryMaps)
+        self.__proxy.rowsRemoved.connect(self.__invalidateSelectedMemoryMaps)
+        self.__proxy.dataChanged.connect(self.__invalidateSelectedMemoryMaps)
+
+    def __invalidateSelectedMemoryMaps(self):
+        self.__selectedMemoryMaps = None
+
     def setModel(self, model: Qt.QAbstractItemModel):
         self.__columned.setSourceModel(model)
 
@@ -54,9 +66,13 @@ class MemoryMapListView(Qt.QWidget):
         return mem
 
     def selectedMemoryMaps(self) -> list[MemoryMap]:
-        model = self.__table.selectionModel()
-        items = model.selectedRows()
-        return [i.data(Qt.Qt.UserRole) for i in items]
+        mems = self.__selectedMemoryMaps
+        if mems is None:
+            model = self.__table.selectionModel()
+            items = model.selectedRows()
+            mems = [i.data(Qt.Qt.UserRole) for i in items]
+            self.__selectedMemoryMaps = mems
+        return list(mems)
 
     def currentMemoryMap(self) -> MemoryMap | None:
         """Return the current memory map."""
@@ -1,18 +1,44 @@
 from __future__ import annotations
 
+import bisect
 import logging
 import numpy
 import typing
 import lru
 from PyQt5 import Qt
 
-from .object_list_model import ObjectListModel
 from .tooltip_factory import TooltipFactory
+from . import ui_styles
 from ..gba_file import MemoryMap, ByteCodec, DataType
 
 
+# Roles displaying the same text
+_DISPLAY_ROLES = frozenset({Qt.Qt.DisplayRole, Qt.Qt.EditRole})
+
+# Integer code of each data type, for the memory map columns
+_DATA_TYPE_CODES: dict[DataType | None, int] = {
+    dataType: code for code, dataType in enumerate([None, *DataType])
+}
+
+
+def _memoryMapColumns(mems: list[MemoryMap]) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the data type codes and the byte payloads of memory maps"""
+    count = len(mems)
+    dataTypes = numpy.fromiter(
+        (_DATA_TYPE_CODES[mem.data_type] for mem in mems),
+        dtype=numpy.uint8,
+        count=count,
+    )
+    bytePayloads = numpy.fromiter(
+        (mem.byte_effective_length for mem in mems),
+        dtype=numpy.int64,
+        count=count,
+    )
+    return dataTypes, bytePayloads
+
+
 class MemoryMapFilter(typing.NamedTuple):
-    shownDataTypes: set[DataType] | None = None
+    shownDataTypes: frozenset[DataType] | None = None
     minBytePayload: int | None = None
     maxBytePayload: int | None = None
 
@@ -20,7 +46,7 @@ class MemoryMapFilter(typing.NamedTuple):
         if self.shownDataTypes is not None:
             if mem.data_type not in self.shownDataTypes:
                 return False
-        bytePayload = mem.byte_payload or mem.byte_length or 0
+        bytePayload = mem.byte_effective_length
         if self.minBytePayload is not None:
             if bytePayload < self.minBytePayload:
                 return False
@@ -29,29 +55,259 @@ class MemoryMapFilter(typing.NamedTuple):
                 return False
         return True
 
+    def acceptsMask(self, dataTypes: numpy.ndarray, bytePayloads: numpy.ndarray) -> numpy.ndarray:
+        """Returns the accepted memory maps as a boolean mask.
+
+        The memory maps are described by their data type codes and byte
+        payloads, as returned by `_memoryMapColumns`.
+        """
+        mask = numpy.ones(len(dataTypes), dtype=bool)
+        if self.shownDataTypes is not None:
+            codes = [_DATA_TYPE_CODES[t] for t in self.shownDataTypes]
+            mask &= numpy.isin(dataTypes, codes)
+        if self.minBytePayload is not None:
+            mask &= bytePayloads >= self.minBytePayload
+        if self.maxBytePayload is not None:
+            mask &= bytePayloads <= self.maxBytePayload
+        return mask
+
+
+_FORMATTED_SIZES: lru.LRU[int, str] = lru.LRU(4096)
+
 
 def format_size(size: int) -> str:
+    text = _FORMATTED_SIZES.get(size, None)
+    if text is not None:
+        return text
     if size < 2 * 1024:
-        return f"{size} B"
+        text = f"{size} B"
     elif size < 1024 * 1024:
-        return f"{size // (1024)} KiB"
-    return f"{size // (1024 * 1024)} MiB"
+        text = f"{size >> 10} KiB"
+    else:
+        text = f"{size >> 20} MiB"
+    _FORMATTED_SIZES[size] = text
+    return text
 
 
-class MemoryMapProxyModel(Qt.QSortFilterProxyModel):
-    """Filter and create multiple columns from the original model"""
+class MemoryMapProxyModel(Qt.QAbstractProxyModel):
+    """Filter and create multiple columns from the original model.
+
+    The source model is a flat list of memory maps. The accepted source
+    rows are stored as a sorted list, which is only rebuilt when the
+    filter or the whole source changes.
+    """
 
     ColumnAddress = 0
     ColumnMemory = 1
     NbColumns = 2
 
+    # Roles provided by the memory column, others are left to Qt
+    _MEMORY_ROLES = frozenset({
+        Qt.Qt.DisplayRole,
+        Qt.Qt.EditRole,
+        Qt.Qt.ToolTipRole,
+        Qt.Qt.DecorationRole,
+    })
+
     def __init__(self, parent: Qt.QObject | None = None):
-        Qt.QSortFilterProxyModel.__init__(self, parent=parent)
+        Qt.QAbstractProxyModel.__init__(self, parent=parent)
         self._filter: MemoryMapFilter | None = None
+        self.__formattedAddresses: lru.LRU[int, str] = lru.LRU(8192)
+        # Sorted source rows displayed by this model
+        self.__rows: list[int] = []
+        # Proxy rows removed between rowsAboutToBeRemoved and rowsRemoved
+        self.__removing: tuple[int, int] | None = None
+        self.__connections: list[Qt.QMetaObject.Connection] = []
+        # Data type codes and byte payloads of the source memory maps, to
+        # filter all the rows at once. None until needed by a filter
+        self.__columns: tuple[numpy.ndarray, numpy.ndarray] | None = None
+
+    def setSourceModel(self, sourceModel: Qt.QAbstractItemModel | None):
+        self.beginResetModel()
+        for connection in self.__connections:
+            self.disconnect(connection)
+        self.__connections = []
+        Qt.QAbstractProxyModel.setSourceModel(self, sourceModel)
+        if sourceModel is not None:
+            self.__connections = [
+                sourceModel.modelAboutToBeReset.connect(self.beginResetModel),
+                sourceModel.modelReset.connect(self.__onSourceReset),
+                sourceModel.layoutAboutToBeChanged.connect(self.beginResetModel),
+                sourceModel.layoutChanged.connect(self.__onSourceReset),
+                sourceModel.rowsInserted.connect(self.__onSourceRowsInserted),
+                sourceModel.rowsAboutToBeRemoved.connect(self.__onSourceRowsAboutToBeRemoved),
+                sourceModel.rowsRemoved.connect(self.__onSourceRowsRemoved),
+                sourceModel.dataChanged.connect(self.__onSourceDataChanged),
+            ]
+        self.__columns = None
+        self.__rows = self.__allAcceptedRows()
+        self.endResetModel()
+
+    def __sourceRowCount(self) -> int:
+        sourceModel = self.sourceModel()
+        if sourceModel is None:
+            return 0
+        return sourceModel.rowCount()
+
+    def __accepts(self, sourceRow: int) -> bool:
+        filter = self._filter
+        if filter is None:
+            return True
+        return filter.accepts(self.sourceModel().objectAt(sourceRow))
+
+    def __acceptedRows(self, first: int, end: int) -> list[int]:
+        """Returns the accepted source rows in the range [first, end)"""
+        filter = self._filter
+        if filter is None:
+            return list(range(first, end))
+        objectAt = self.sourceModel().objectAt
+        accepts = filter.accepts
+        return [row for row in range(first, end) if accepts(objectAt(row))]
+
+    def __allAcceptedRows(self) -> list[int]:
+        """Returns all the accepted source rows"""
+        filter = self._filter
+        if filter is None:
+            return list(range(self.__sourceRowCount()))
+        if self.__columns is None:
+            self.__columns = self.__memoryMapColumns(0, self.__sourceRowCount())
+        mask = filter.acceptsMask(*self.__columns)
+        return numpy.flatnonzero(mask).tolist()
+
+    def __memoryMapColumns(self, first: int, end: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+        objectAt = self.sourceModel().objectAt
+        return _memoryMapColumns([objectAt(row) for row in range(first, end)])
+
+    def __onSourceReset(self):
+        self.__columns = None
+        self.__rows = self.__allAcceptedRows()
+        self.endResetModel()
 
-    def columnCount(self, parent: Qt.QModelIndex) -> int:
+    def __onSourceRowsInserted(self, parent: Qt.QModelIndex, first: int, last: int):
+        if self.__columns is not None:
+            dataTypes, bytePayloads = self.__memoryMapColumns(first, last + 1)
+            self.__columns = (
+                numpy.insert(self.__columns[0], first, dataTypes),
+                numpy.insert(self.__columns[1], first, bytePayloads),
+            )
+        count = last - first + 1
+        rows = self.__rows
+        pos = bisect.bisect_left(rows, first)
+        shifted = rows[:pos] + [row + count for row in rows[pos:]]
+        # The existing rows must map the shifted source rows before
+        # beginInsertRows, as the source was already updated
+        self.__rows = shifted
+        inserted = self.__acceptedRows(first, last + 1)
+        if len(inserted) == 0:
+            return
+        self.beginInsertRows(Qt.QModelIndex(), pos, pos + len(inserted) - 1)
+        shifted[pos:pos] = inserted
+        self.endInsertRows()
+
+    def __onSourceRowsAboutToBeRemoved(self, parent: Qt.QModelIndex, first: int, last: int):
+        rows = self.__rows
+        begin = bisect.bisect_left(rows, first)
+        end = bisect.bisect_right(rows, last)
+        if begin != end:
+            self.beginRemoveRows(Qt.QModelIndex(), begin, end - 1)
+        self.__removing = begin, end
+
+    def __onSourceRowsRemoved(self, parent: Qt.QModelIndex, first: int, last: int):
+        assert self.__removing is not None
+        begin, end = self.__removing
+        self.__removing = None
+        if self.__columns is not None:
+            removed = slice(first, last + 1)
+            self.__columns = (
+                numpy.delete(self.__columns[0], removed),
+                numpy.delete(self.__columns[1], removed),
+            )
+        count = last - first + 1
+        rows = self.__rows
+        self.__rows = rows[:begin] + [row - count for row in rows[end:]]
+        if begin != end:
+            self.endRemoveRows()
+
+    def __onSourceDataChanged(
+        self,
+        topLeft: Qt.QModelIndex,
+        bottomRight: Qt.QModelIndex,
+        roles: typing.Sequence[int] = (),
+    ):
+        first, last = topLeft.row(), bottomRight.row()
+        if self.__columns is not None:
+            dataTypes, bytePayloads = self.__memoryMapColumns(first, last + 1)
+            self.__columns[0][first:last + 1] = dataTypes
+            self.__columns[1][first:last + 1] = bytePayloads
+        if self._filter is not None:
+            # The filter result can change with the object
+            for sourceRow in range(first, last + 1):
+                accepted = self.__accepts(sourceRow)
+                rows = self.__rows
+                pos = bisect.bisect_left(rows, sourceRow)
+                present = pos < len(rows) and rows[pos] == sourceRow
+                if present and not accepted:
+                    self.beginRemoveRows(Qt.QModelIndex(), pos, pos)
+                    del rows[pos]
+                    self.endRemoveRows()
+                elif accepted and not present:
+                    self.beginInsertRows(Qt.QModelIndex(), pos, pos)
+                    rows.insert(pos, sourceRow)
+                    self.endInsertRows()
+        rows = self.__rows
+        begin = bisect.bisect_left(rows, first)
+        end = bisect.bisect_right(rows, last)
+        if begin != end:
+            self.dataChanged.emit(
+                self.index(begin, 0),
+                self.index(end - 1, self.NbColumns - 1),
+                roles,
+            )
+
+    def index(self, row: int, column: int, parent: Qt.QModelIndex = Qt.QModelIndex()) -> Qt.QModelIndex:
+        if parent.isValid():
+            return Qt.QModelIndex()
+        if not 0 <= row < len(self.__rows) or not 0 <= column < self.NbColumns:
+            return Qt.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: Qt.QModelIndex) -> Qt.QModelIndex:
+        return Qt.QModelIndex()
+
+    def sibling(self, row: int, column: int, index: Qt.QModelIndex) -> Qt.QModelIndex:
+        return self.index(row, column)
+
+    def rowCount(self, parent: Qt.QModelIndex = Qt.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.__rows)
+
+    def hasChildren(self, parent: Qt.QModelIndex = Qt.QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return len(self.__rows) != 0
+
+    def columnCount(self, parent: Qt.QModelIndex = Qt.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
         return self.NbColumns
 
+    def mapToSource(self, proxyIndex: Qt.QModelIndex) -> Qt.QModelIndex:
+        if not proxyIndex.isValid():
+            return Qt.QModelIndex()
+        sourceRow = self.__rows[proxyIndex.row()]
+        return self.sourceModel().index(sourceRow, proxyIndex.column())
+
+    def mapFromSource(self, sourceIndex: Qt.QModelIndex) -> Qt.QModelIndex:
+        if not sourceIndex.isValid():
+            return Qt.QModelIndex()
+        sourceRow = sourceIndex.row()
+        rows = self.__rows
+        pos = bisect.bisect_left(rows, sourceRow)
+        if pos == len(rows) or rows[pos] != sourceRow:
+            return Qt.QModelIndex()
+        return self.createIndex(pos, sourceIndex.column())
+
     def objectIndex(self, obj: typing.Any) -> Qt.QModelIndex:
         sourceModel = self.sourceModel()
         sourceIndex = sourceModel.objectIndex(obj)
@@ -60,34 +316,66 @@ class MemoryMapProxyModel(Qt.QSortFilterProxyModel):
         return self.mapFromSource(sourceIndex)
 
     def object(self, index: Qt.QModelIndex) -> typing.Any:
-        sourceModel = self.sourceModel()
-        sourceIndex = self.mapToSource(index)
-        if not sourceIndex.isValid():
+        if not index.isValid():
             return None
-        return sourceIndex.data(ObjectListModel.ObjectRole)
+        return self.sourceModel().objectAt(self.__rows[index.row()])
 
     def setFilter(self, filter: MemoryMapFilter | None):
         self._filter = filter
-        self.invalidateFilter()
+        rows = self.__allAcceptedRows()
+
+        # Remove the hidden ranges from the end, so the views drop them
+        # from their selection
+        accepted = set(rows)
+        current = self.__rows
+        end = len(current)
+        while end > 0:
+            if current[end - 1] in accepted:
+                end -= 1
+                continue
+            begin = end - 1
+            while begin > 0 and current[begin - 1] not in accepted:
+                begin -= 1
+            self.beginRemoveRows(Qt.QModelIndex(), begin, end - 1)
+            del current[begin:end]
+            self.endRemoveRows()
+            end = begin
+
+        # Then insert the shown ranges in order
+        kept = set(current)
+        begin = 0
+        while begin < len(rows):
+            if rows[begin] in kept:
+                begin += 1
+                continue
+            end = begin + 1
+            while end < len(rows) and rows[end] not in kept:
+                end += 1
+            self.beginInsertRows(Qt.QModelIndex(), begin, end - 1)
+            current[begin:begin] = rows[begin:end]
+            self.endInsertRows()
+            begin = end
 
     def data(self, index: Qt.QModelIndex, role: int = Qt.Qt.DisplayRole):
         if not index.isValid():
             return None
 
         column = index.column()
-        sourceModel = self.sourceModel()
-        firstColumn = self.index(index.row(), 0)
-        sourceIndex = self.mapToSource(index)
 
         if column == self.ColumnAddress:
-            if role in (Qt.Qt.DisplayRole, Qt.Qt.EditRole):
-                mem = sourceIndex.data(ObjectListModel.ObjectRole)
-                return f"{mem.byte_offset:08X}h"
-            return sourceIndex.data(role=role)
-
-        if column == self.ColumnMemory:
-            mem = sourceIndex.data(ObjectListModel.ObjectRole)
-            if role in (Qt.Qt.DisplayRole, Qt.Qt.EditRole):
+            if role in _DISPLAY_ROLES:
+                mem = self.sourceModel().objectAt(self.__rows[index.row()])
+                byteOffset = mem.byte_offset
+                text = self.__formattedAddresses.get(byteOffset, None)
+                if text is None:
+                    text = f"{byteOffset:08X}h"
+                    self.__formattedAddresses[byteOffset] = text
+                return text
+            return self.mapToSource(index).data(role)
+
+        if column == self.ColumnMemory and role in self._MEMORY_ROLES:
+            mem = self.sourceModel().objectAt(self.__rows[index.row()])
+            if role in _DISPLAY_ROLES:
                 byteCodec = mem.byte_codec
                 if byteCodec is None or byteCodec == ByteCodec.RAW:
                     uncompressed = mem.byte_length
@@ -108,7 +396,7 @@ class MemoryMapProxyModel(Qt.QSortFilterProxyModel):
                     tooltip.addRow("Codec", f"{byteCodec.name}")
                     tooltip.addRow("Compressed", f"{compressed} B")
                 else:
-                    uncompressed = mem.byte_payload or mem.byte_length or 0
+                    uncompressed = mem.byte_effective_length
                     compression = f"×{uncompressed / compressed:0.2f}" if compressed != 0 else "NA"
                     tooltip.addRow("Size", f"{uncompressed} B")
                     tooltip.addRow("Codec", f"{byteCodec.name}")
@@ -116,28 +404,6 @@ class MemoryMapProxyModel(Qt.QSortFilterProxyModel):
                     tooltip.addRow("Ratio", f"{compression}")
                 return tooltip.html()
             if role == Qt.Qt.DecorationRole:
-                byteCodec = mem.byte_codec
-                if byteCodec is None or byteCodec == ByteCodec.RAW:
-                    return Qt.QIcon("icons:empty.png")
-                if byteCodec == ByteCodec.RL:
-                    return Qt.QIcon("icons:rl.png")
-                if byteCodec == ByteCodec.LZ77:
-                    return Qt.QIcon("icons:lz77.png")
-                if byteCodec == ByteCodec.HUFFMAN:
-                    return Qt.QIcon("icons:huffman.png")
-                if byteCodec == ByteCodec.HUFFMAN_OVER_LZ77:
-                    return Qt.QIcon("icons:huffman_lz77.png")
-                return Qt.QIcon("icons:lz77.png")
-
-        return Qt.QSortFilterProxyModel.data(self, index, role)
-
-    def filterAcceptsRow(self, source_row: int, source_parent: Qt.QModelIndex) -> bool:
-        sourceModel = self.sourceModel()
-        index = sourceModel.index(source_row, 0, source_parent)
-        if not index.isValid():
-            return True
-        mem = sourceModel.data(index, role=ObjectListModel.ObjectRole)
-        filter = self._filter
-        if filter is None:
-            return True
-        return filter.accepts(mem)
+                return ui_styles.getIcon(mem.byte_codec)
+
+        return Qt.QAbstractProxyModel.data(self, index, role)
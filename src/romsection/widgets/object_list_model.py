@@ -13,41 +13,123 @@ class ObjectListModel(Qt.QAbstractItemModel):
     def __init__(self, parent: Qt.QObject | None = None):
         super().__init__(parent=parent)
         self.__items: list[typing.Any] = []
+        # Row of the objects indexed by their id, None if outdated
+        self.__rows: dict[int, int] | None = None
 
     def __iter__(self):
         for i in range(self.rowCount()):
             yield self.__items[i]
 
+    def __rowOf(self, obj: typing.Any) -> int:
+        """Returns the row of an object.
+
+        Raises:
+            ValueError: If the object is not part of the list
+        """
+        rows = self.__rows
+        if rows is None:
+            items = self.__items
+            # Built from the end, so the first occurrence of an object wins
+            rows = dict(zip(map(id, reversed(items)), range(len(items) - 1, -1, -1)))
+            self.__rows = rows
+        row = rows.get(id(obj))
+        if row is None:
+            # It can still be equal to one of the items
+            return self.__items.index(obj)
+        return row
+
+    def __replaceRow(self, row: int, currentObj: typing.Any, nextObj: typing.Any):
+        """Update the row index when an object is replaced by another one"""
+        rows = self.__rows
+        if rows is None:
+            return
+        if rows.get(id(currentObj)) == row:
+            # Other occurrences are still found by equality
+            del rows[id(currentObj)]
+        nextRow = rows.get(id(nextObj))
+        if nextRow is None or nextRow > row:
+            rows[id(nextObj)] = row
+
     def setObjectList(self, items: list[typing.Any]):
+        previous = self.__items
+        if (
+            previous is not items
+            and 0 < len(previous) <= len(items)
+            and all(a is b for a, b in zip(previous, items))
+        ):
+            # The previous items are kept, only new items are inserted
+            if len(previous) == len(items):
+                self.__items = items
+                return
+            self.beginInsertRows(Qt.QModelIndex(), len(previous), len(items) - 1)
+            self.__items = items
+            self.__rows = None
+            self.endInsertRows()
+            return
+
         self.beginResetModel()
         self.__items = items
+        self.__rows = None
         self.endResetModel()
 
     def setObject(self, index: int, obj: typing.Any):
         """Replace an existing item of this list"""
+        self.__replaceRow(index, self.__items[index], obj)
         self.__items[index] = obj
-        self.dataChanged.emit(index, index)
+        modelIndex = self.index(index, 0)
+        self.dataChanged.emit(modelIndex, modelIndex)
 
     def replaceObject(self, currentObj: typing.Any, nextObj: typing.Any):
         """Replace an existing item of this list"""
-        index = self.objectIndex(currentObj)
-        self.__items[index.row()] = nextObj
+        row = self.__rowOf(currentObj)
+        self.__items[row] = nextObj
+        self.__replaceRow(row, currentObj, nextObj)
+        index = self.index(row, 0)
         self.dataChanged.emit(index, index)
 
+    def replaceObjects(self, row: int, count: int, objs: list[typing.Any]):
+        """Replace `count` items starting at `row` by a list of objects.
+
+        The previous items are removed, then the new ones are inserted,
+        with a single notification for each step. Views drop the selection
+        of the removed items.
+        """
+        if count != 0:
+            self.beginRemoveRows(Qt.QModelIndex(), row, row + count - 1)
+            del self.__items[row:row + count]
+            self.__rows = None
+            self.endRemoveRows()
+        if len(objs) != 0:
+            self.beginInsertRows(Qt.QModelIndex(), row, row + len(objs) - 1)
+            self.__items[row:row] = objs
+            self.__rows = None
+            self.endInsertRows()
+
     def updatedObject(self, obj: typing.Any):
         """To be called when a mutable item was changed"""
-        index = self.objectIndex(obj)
+        index = self.index(self.__rowOf(obj), 0)
         self.dataChanged.emit(index, index)
 
     def insertObject(self, index: int, obj: typing.Any):
         self.beginInsertRows(Qt.QModelIndex(), index, index)
         self.__items.insert(index, obj)
+        self.__rows = None
+        self.endInsertRows()
+
+    def insertObjects(self, index: int, objs: list[typing.Any]):
+        """Insert consecutive objects with a single notification"""
+        if len(objs) == 0:
+            return
+        self.beginInsertRows(Qt.QModelIndex(), index, index + len(objs) - 1)
+        self.__items[index:index] = objs
+        self.__rows = None
         self.endInsertRows()
 
     def removeObject(self, obj: typing.Any):
-        index = self.__items.index(obj)
+        index = self.__rowOf(obj)
         self.beginRemoveRows(Qt.QModelIndex(), index, index)
         del self.__items[index]
+        self.__rows = None
         self.endRemoveRows()
 
     def rowCount(self, parent: Qt.QModelIndex = Qt.QModelIndex()):
@@ -61,14 +143,18 @@ class ObjectListModel(Qt.QAbstractItemModel):
 
     def objectIndex(self, obj) -> Qt.QModelIndex:
         try:
-            row = self.__items.index(obj)
-            return self.index(row, 0)
-        except IndexError:
+            row = self.__rowOf(obj)
+        except ValueError:
             return Qt.QModelIndex()
+        return self.index(row, 0)
 
     def object(self, index: Qt.QModelIndex) -> typing.Any:
         return self.data(index, role=self.ObjectRole)
 
+    def objectAt(self, row: int) -> typing.Any:
+        """Returns the object at this row, without creating an index"""
+        return self.__items[row]
+
     def parent(self, index: Qt.QModelIndex):
         return Qt.QModelIndex()
 
@@ -3,21 +3,23 @@ from __future__ import annotations
 import logging
 import numpy
 import typing
+import weakref
 import lru
 from PyQt5 import Qt
 
-from .object_list_model import ObjectListModel
-from ..gba_file import GBAFile, MemoryMap, DataType
+from ..gba_file import GBAFile, MemoryMap, DataType, palette_key
 
 
-_palettePreview: lru.LRU[int, Qt.QIcon] = lru.LRU(512)
+# Icons indexed by the pixels they display, shared by identical palettes
+# for as long as a model uses them
+_paletteIcons: weakref.WeakValueDictionary[bytes, Qt.QIcon] = weakref.WeakValueDictionary()
 
 
 def createPaletteIcon(rom: GBAFile, mem: MemoryMap) -> Qt.QIcon:
     """
     Create an icon preview from a memory map.
 
-    This icons are cached into a global structure.
+    Icons displaying the same colors are shared.
     """
     try:
         data = rom.palette_data(mem)
@@ -33,36 +35,50 @@ def createPaletteIcon(rom: GBAFile, mem: MemoryMap) -> Qt.QIcon:
     if mem.palette_size in [None, 16]:
         if size != 16:
             return Qt.QIcon()
-        image = Qt.QImage(
-            paletteData[:, 0:3].tobytes(),
-            16,
-            1,
-            Qt.QImage.Format_RGB888,
-        )
-        pixmap = Qt.QPixmap.fromImage(image)
-        pixmap = pixmap.scaled(16, 16, Qt.Qt.IgnoreAspectRatio, Qt.Qt.FastTransformation)
+        # Each color fills a column of the icon
+        pixels = paletteData.tobytes() * 16
     elif mem.palette_size == 256:
         if size != 256:
             return Qt.QIcon()
-        image = Qt.QImage(
-            paletteData[:, 0:3].tobytes(),
-            16,
-            16,
-            Qt.QImage.Format_RGB888,
-        )
-        pixmap = Qt.QPixmap.fromImage(image)
+        pixels = paletteData.tobytes()
     else:
         return Qt.QIcon()
 
-    return Qt.QIcon(pixmap)
+    icon = _paletteIcons.get(pixels)
+    if icon is not None:
+        return icon
+
+    image = Qt.QImage(
+        pixels,
+        16,
+        16,
+        16 * 4,
+        Qt.QImage.Format_RGBX8888,
+    )
+    pixmap = Qt.QPixmap.fromImage(image)
+    icon = Qt.QIcon(pixmap)
+    _paletteIcons[pixels] = icon
+    return icon
 
 
 class PaletteFilterProxyModel(Qt.QSortFilterProxyModel):
+
+    # Roles computed by this model, others are read from the source
+    _HANDLED_ROLES = frozenset({
+        Qt.Qt.DisplayRole,
+        Qt.Qt.EditRole,
+        Qt.Qt.DecorationRole,
+    })
+
     def __init__(self, parent: Qt.QObject | None = None):
         Qt.QSortFilterProxyModel.__init__(self, parent=parent)
         self._rom: GBAFile | None = None
+        self.__palettePreview: lru.LRU[tuple, Qt.QIcon] = lru.LRU(512)
 
     def setRom(self, rom: GBAFile | None):
+        if self._rom is not rom:
+            # The icons are only valid for a ROM
+            self.__palettePreview.clear()
         self._rom = rom
 
     def objectIndex(self, obj: typing.Any) -> Qt.QModelIndex:
@@ -73,17 +89,14 @@ class PaletteFilterProxyModel(Qt.QSortFilterProxyModel):
         return self.mapFromSource(sourceIndex)
 
     def object(self, index: Qt.QModelIndex) -> typing.Any:
-        return self.data(index, role=ObjectListModel.ObjectRole)
+        sourceIndex = self.mapToSource(index)
+        if not sourceIndex.isValid():
+            return None
+        return self.sourceModel().objectAt(sourceIndex.row())
 
     def data(self, index: Qt.QModelIndex, role: int = Qt.Qt.DisplayRole):
-        global _palettePreview
-        if role in (Qt.Qt.DisplayRole, Qt.Qt.EditRole):
-            if not index.isValid():
-                return ""
-            mem = self.object(index)
-            if mem is None:
-                return "No palette"
-            return f"Palette 0x{mem.byte_offset:08X}"
+        if role not in self._HANDLED_ROLES:
+            return Qt.QSortFilterProxyModel.data(self, index, role)
         if role == Qt.Qt.DecorationRole:
             if not index.isValid():
                 return Qt.QIcon()
@@ -92,18 +105,19 @@ class PaletteFilterProxyModel(Qt.QSortFilterProxyModel):
             mem = self.object(index)
             if mem is None:
                 return Qt.QIcon()
-            # FIXME: Use a hash from the mem state
-            icon = _palettePreview.get(mem.byte_offset)
+            key = palette_key(mem)
+            icon = self.__palettePreview.get(key)
             if icon is None:
                 icon = createPaletteIcon(self._rom, mem)
-                _palettePreview[mem.byte_offset] = icon
+                self.__palettePreview[key] = icon
             return icon
-        return Qt.QSortFilterProxyModel.data(self, index, role)
+        if not index.isValid():
+            return ""
+        mem = self.object(index)
+        if mem is None:
+            return "No palette"
+        return f"Palette 0x{mem.byte_offset:08X}"
 
     def filterAcceptsRow(self, source_row: int, source_parent: Qt.QModelIndex) -> bool:
-        sourceModel = self.sourceModel()
-        index = sourceModel.index(source_row, 0, source_parent)
-        if not index.isValid():
-            return True
-        mem = sourceModel.data(index, role=ObjectListModel.ObjectRole)
+        mem = self.sourceModel().objectAt(source_row)
         return mem.data_type == DataType.PALETTE
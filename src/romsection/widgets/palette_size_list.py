@@ -13,14 +13,18 @@ class PaletteSizeList(Qt.QListWidget):
         self.setSizeAdjustPolicy(Qt.QListWidget.AdjustToContents)
         self.setResizeMode(Qt.QListView.Fixed)
 
+        self.__rowByValue: dict[int, int] = {}
+
         item = Qt.QListWidgetItem()
         item.setText(f"16 colors")
         item.setData(Qt.Qt.UserRole, 16)
+        self.__rowByValue[16] = self.count()
         self.addItem(item)
 
         item = Qt.QListWidgetItem()
         item.setText(f"256 colors")
         item.setData(Qt.Qt.UserRole, 256)
+        self.__rowByValue[256] = self.count()
         self.addItem(item)
 
         rect = self.visualItemRect(item)
@@ -41,11 +45,10 @@ class PaletteSizeList(Qt.QListWidget):
     def _findItemFromValue(self, size: int | None) -> Qt.QListWidgetItem | None:
         if size is None:
             return None
-        for i in range(self.count()):
-            item = self.item(i)
-            if item.data(Qt.Qt.UserRole) == size:
-                return item
-        return None
+        row = self.__rowByValue.get(size)
+        if row is None:
+            return None
+        return self.item(row)
 
     def selectValue(self, size: int | None):
         item = self._findItemFromValue(size)
@@ -93,6 +93,8 @@ class PixelBrowserView(Qt.QWidget):
         self.__selectionFrom: int = -1
         self.__selectionTo: int = -1
         self.__inSelection = False
+        # Images of the last paint, with the state used to decode them
+        self.__imageCache: tuple[tuple, Qt.QImage, Qt.QImage | None] | None = None
 
     def paintEvent(self, event: Qt.QPaintEvent):
         painter = Qt.QPainter(self)
@@ -113,20 +115,26 @@ class PixelBrowserView(Qt.QWidget):
         height = self._getConstrainedHeight(visibleHeight)
         width = self._getConstrainedWidth(self.__pixelWidth)
 
-        nb_pixels = width * height
-        nb_bytes = self._getNbBytesPerPixels(nb_pixels)
+        # The selection or the zoom can change without the displayed data
+        key = self.__pos, width, height, self.__colorMode, self.__pixelOrder
+        cache = self.__imageCache
+        if cache is not None and cache[0] == key:
+            _, image, lastRowImage = cache
+        else:
+            nb_pixels = width * height
+            nb_bytes = self._getNbBytesPerPixels(nb_pixels)
 
-        binaryData = self._readBytes(self.__pos, nb_bytes)
-        nbEasyBytes = self._getNbBytesForEasyDisplay(len(binaryData), width)
-        easyBytes = binaryData[0:nbEasyBytes]
-        image = self._toImage(easyBytes, width)
-        painter.drawImage(Qt.QPoint(0, 0), image)
+            binaryData = self._readBytes(self.__pos, nb_bytes)
+            nbEasyBytes = self._getNbBytesForEasyDisplay(len(binaryData), width)
+            easyBytes = binaryData[0:nbEasyBytes]
+            image = self._toImage(easyBytes, width)
+            remainingBytes = binaryData[nbEasyBytes:]
+            lastRowImage = self._toImageFromLastRow(remainingBytes)
+            self.__imageCache = key, image, lastRowImage
 
-        pos = image.height()
-        remainingBytes = binaryData[nbEasyBytes:]
-        image = self._toImageFromLastRow(remainingBytes)
-        if image is not None:
-            painter.drawImage(Qt.QPoint(0, pos), image)
+        painter.drawImage(Qt.QPoint(0, 0), image)
+        if lastRowImage is not None:
+            painter.drawImage(Qt.QPoint(0, image.height()), lastRowImage)
 
         painter.resetTransform()
 
@@ -206,6 +214,7 @@ class PixelBrowserView(Qt.QWidget):
         if self.__memory == memory:
             return
         self.__memory = memory
+        self.__imageCache = None
 
         self.__memory.seek(0, os.SEEK_END)
         self.__len = self.__memory.tell()
@@ -386,18 +395,22 @@ class PixelBrowserView(Qt.QWidget):
             array.shape = height, width, -1
             array = array_utils.convert_to_tiled_8x8(array)
 
+        # The image uses the array buffer without copy, and keeps a reference to it
+        array = numpy.ascontiguousarray(array)
         if self.__colorMode in [ImageColorMode.INDEXED_8BIT, ImageColorMode.INDEXED_4BIT]:
             image = Qt.QImage(
-                array.tobytes(),
+                array.data,
                 width,
                 height,
+                width,
                 Qt.QImage.Format_Grayscale8,
             )
         else:
             image = Qt.QImage(
-                array.tobytes(),
+                array.data,
                 width,
                 height,
+                width * 4,
                 Qt.QImage.Format_ARGB32,
             )
         return image
@@ -43,6 +43,10 @@ class ProxyColumnModel(Qt.QIdentityProxyModel):
     def object(self, index: Qt.QModelIndex) -> typing.Any:
         return self.data(index, role=ObjectListModel.ObjectRole)
 
+    def objectAt(self, row: int) -> typing.Any:
+        """Returns the object at this row of the source model"""
+        return self.sourceModel().objectAt(row)
+
     def objectIndex(self, obj: typing.Any) -> Qt.QModelIndex:
         sourceModel = self.sourceModel()
         sourceIndex = sourceModel.objectIndex(obj)
@@ -1,10 +1,16 @@
 import typing
 from PyQt5 import Qt
 
-from .. model import DataTypeGroup, DataType
+from .. model import DataTypeGroup, DataType, ByteCodec
 
 
 ICONS = {
+    # ByteCodec
+    ByteCodec.RAW: "icons:empty.png",
+    ByteCodec.RL: "icons:rl.png",
+    ByteCodec.LZ77: "icons:lz77.png",
+    ByteCodec.HUFFMAN: "icons:huffman.png",
+    ByteCodec.HUFFMAN_OVER_LZ77: "icons:huffman_lz77.png",
     # DataTypeGroup
     DataTypeGroup.IMAGE: "icons:image.png",
     DataTypeGroup.PALETTE: "icons:palette.png",
@@ -21,11 +27,23 @@ ICONS = {
 }
 
 
+_ICON_CACHE: dict[str, Qt.QIcon] = {}
+
+
+def getIconFromName(name: str) -> Qt.QIcon:
+    """Return a shared QIcon for this resource name."""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = Qt.QIcon(name)
+        _ICON_CACHE[name] = icon
+    return icon
+
+
 def getIcon(obj: typing.Any) -> Qt.QIcon:
     name = ICONS.get(obj, None)
     if name is None:
         if isinstance(obj, DataType):
             name = ICONS.get(obj.value.group, None)
     if name is None:
-        return Qt.QIcon("icons:empty.png")
-    return Qt.QIcon(name)
+        return getIconFromName("icons:empty.png")
+    return getIconFromName(name)
@@ -31,3 +31,31 @@ def test_parse_psg():
     data = b"\x04\x3c\x00\x00\x01\x00\x00\x00\x00\x00\x0f\x00"
     result = sappy_utils.InstrumentItem.parse(data)
     assert isinstance(result, sappy_utils.InstrumentPsgItem)
+
+
+def test_instrument_short_descriptions():
+    items = [
+        b"\x00\x3c\x00\x00\x00\x00\x00\x08\xff\x00\xff\x00",
+        b"\x04\x3c\x00\x00\x01\x00\x00\x00\x00\x00\x0f\x00",
+        b"\x40\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x08",
+        b"\x80\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00",
+        sappy_utils.UNUSED_INSTRUMENT,
+        b"\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00",
+    ]
+    data = b"".join(items) + b"\x00\x00"
+    expected = [sappy_utils.InstrumentItem.parse(i).short_description for i in items]
+    result = sappy_utils.InstrumentItem.parse_short_descriptions(data)
+    assert result == expected
+
+
+def test_song_table_short_descriptions():
+    items = [
+        b"\x00\x10\x00\x08\x01\x00\x01\x00",
+        b"\x00\x10\x00\x08\x01\x00\x02\x00",
+        b"\x00\x10\x00\x08\x01\x01\x01\x00",
+    ]
+    data = b"".join(items) + b"\x00"
+    expected = [sappy_utils.SongTableItem.parse(i).short_description for i in items]
+    result = sappy_utils.SongTableItem.parse_short_descriptions(data)
+    assert result == expected
+    assert result[0] == "Song header: 00001000h; track group: 1"
@@ -28,6 +28,20 @@ def test_convert_16bx1_to_5bx3():
     numpy.testing.assert_allclose(result, expected)
 
 
+@pytest.mark.parametrize("use_alpha", (True, False))
+def test_convert_a1rgb15_to_argb32(use_alpha):
+    source = numpy.array([0b1111110000000000, 0b0000001111111111], numpy.uint16)
+    expected = numpy.array(
+        [
+            [0xFF, 0x00, 0x00, 0xFF],
+            [0x00, 0xFF, 0xFF, 0x00 if use_alpha else 0xFF],
+        ],
+        dtype=numpy.uint8,
+    )
+    result = array_utils.convert_a1rgb15_to_argb32(source, use_alpha=use_alpha)
+    numpy.testing.assert_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "array,expected",
     (
@@ -0,0 +1,118 @@
+import os
+import random
+import pytest
+from PyQt5 import Qt
+from romsection.model import MemoryMap, DataType
+from romsection.widgets.memory_map_list_model import MemoryMapListModel
+from romsection.widgets.proxy_column_model import ProxyColumnModel
+from romsection.widgets.memory_map_proxy_model import MemoryMapProxyModel, MemoryMapFilter
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = Qt.QApplication.instance()
+    if app is None:
+        app = Qt.QApplication([])
+    return app
+
+
+@pytest.fixture
+def model_failures(qapp):
+    """Collect the failures reported by QAbstractItemModelTester"""
+    failures = []
+
+    def handler(msg_type, context, message):
+        if context.category == "qt.modeltest" and msg_type != Qt.QtDebugMsg:
+            failures.append(message)
+
+    previous = Qt.qInstallMessageHandler(handler)
+    yield failures
+    Qt.qInstallMessageHandler(previous)
+
+
+def create_memory_map(rand: random.Random, byte_offset: int) -> MemoryMap:
+    return MemoryMap(
+        byte_offset=byte_offset,
+        byte_length=rand.randrange(1, 0x400),
+        data_type=rand.choice(list(DataType)),
+    )
+
+
+def create_proxy(memory_maps: list[MemoryMap]):
+    """Create the models as they are chained by MemoryMapListView"""
+    model = MemoryMapListModel()
+    model.setObjectList(memory_maps)
+    columned = ProxyColumnModel()
+    columned.setSourceModel(model)
+    proxy = MemoryMapProxyModel()
+    proxy.setSourceModel(columned)
+    return model, columned, proxy
+
+
+def assert_accepted_rows(model: MemoryMapListModel, proxy: MemoryMapProxyModel, filter: MemoryMapFilter | None):
+    mems = [model.objectAt(row) for row in range(model.rowCount())]
+    expected = [m for m in mems if filter is None or filter.accepts(m)]
+    result = [proxy.object(proxy.index(row, 0)) for row in range(proxy.rowCount())]
+    assert [id(m) for m in result] == [id(m) for m in expected]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_model_tester(model_failures, seed):
+    rand = random.Random(seed)
+    mems = [create_memory_map(rand, i * 0x400) for i in range(16)]
+    model, _columned, proxy = create_proxy(mems)
+    _tester = Qt.QAbstractItemModelTester(
+        proxy,
+        Qt.QAbstractItemModelTester.FailureReportingMode.Warning,
+    )
+    data_types = list(DataType)
+    filter: MemoryMapFilter | None = None
+    byte_offset = 0x100000
+    for _ in range(60):
+        byte_offset += 0x400
+        operation = rand.randrange(5)
+        count = model.rowCount()
+        if operation == 0:
+            new_mems = [create_memory_map(rand, byte_offset + i) for i in range(rand.randrange(1, 4))]
+            model.insertObjects(rand.randrange(count + 1), new_mems)
+        elif operation == 1 and count > 0:
+            model.removeObject(model.objectAt(rand.randrange(count)))
+        elif operation == 2 and count > 2:
+            row = rand.randrange(count - 2)
+            new_mems = [create_memory_map(rand, byte_offset + i) for i in range(rand.randrange(4))]
+            model.replaceObjects(row, rand.randrange(1, 3), new_mems)
+        elif operation == 3 and count > 0:
+            model.setObject(rand.randrange(count), create_memory_map(rand, byte_offset))
+        elif operation == 4:
+            if rand.random() < 0.25:
+                filter = None
+            else:
+                shown_data_types = rand.sample(data_types, rand.randrange(1, len(data_types)))
+                filter = MemoryMapFilter(
+                    shownDataTypes=frozenset(shown_data_types),
+                    minBytePayload=rand.choice([None, 0x80]),
+                )
+            proxy.setFilter(filter)
+        assert_accepted_rows(model, proxy, filter)
+    assert model_failures == []
+
+
+def test_filter_drops_hidden_selection(qapp):
+    mems = [
+        MemoryMap(byte_offset=i * 0x100, byte_length=0x100, data_type=DataType.IMAGE if i % 2 else DataType.PALETTE)
+        for i in range(10)
+    ]
+    model, _columned, proxy = create_proxy(mems)
+    selection_model = Qt.QItemSelectionModel(proxy)
+    changes = []
+    selection_model.selectionChanged.connect(lambda selected, deselected: changes.append(deselected))
+    flags = Qt.QItemSelectionModel.Select | Qt.QItemSelectionModel.Rows
+    selection_model.select(proxy.index(2, 0), flags)
+    selection_model.select(proxy.index(3, 0), flags)
+    changes.clear()
+
+    proxy.setFilter(MemoryMapFilter(shownDataTypes=frozenset({DataType.IMAGE})))
+    assert len(changes) == 1
+    selected = [proxy.object(i) for i in selection_model.selectedRows()]
+    assert selected == [mems[3]]